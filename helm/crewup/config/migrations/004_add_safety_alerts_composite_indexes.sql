@@ -0,0 +1,14 @@
+-- Migration: Composite indexes for safety alert list queries (idempotent)
+-- Date: 2026-10-17
+-- Description: Alert lists filter by group or creator and page by created_at DESC.
+-- Composite (filter, created_at DESC) indexes turn those into index range scans
+-- instead of filter + sort; the open-alerts partial index stays small.
+
+CREATE INDEX IF NOT EXISTS idx_safety_alerts_group_created ON safety_alerts(group_id, created_at DESC);
+CREATE INDEX IF NOT EXISTS idx_safety_alerts_user_created ON safety_alerts(user_id, created_at DESC);
+CREATE INDEX IF NOT EXISTS idx_safety_alerts_group_unresolved ON safety_alerts(group_id, created_at DESC)
+    WHERE resolved_at IS NULL;
+
+-- Single-column indexes are now redundant (leading column of the composites above)
+DROP INDEX IF EXISTS idx_safety_alerts_group;
+DROP INDEX IF EXISTS idx_safety_alerts_user;
@@ -0,0 +1,8 @@
+-- Migration: Drop redundant group_members(group_id) index (idempotent)
+-- Date: 2026-10-17
+-- Description: Membership checks filter on (group_id, user_id), which the
+-- PRIMARY KEY (group_id, user_id) already serves as a unique composite B-tree.
+-- Its leading column also covers group_id-only lookups, so the standalone
+-- index only adds write cost on every join/leave.
+
+DROP INDEX IF EXISTS idx_group_members_group;
@@ -0,0 +1,14 @@
+-- Migration: Add id tiebreaker to the safety alert group indexes (idempotent)
+-- Date: 2026-10-17
+-- Description: Alert lists now page by (created_at DESC, id DESC), both by
+-- offset and by keyset cursor. Adding id to the group composites lets the
+-- cursor seek and the ORDER BY ... LIMIT run as one index range scan, with no
+-- sort step for alerts sharing a created_at.
+
+CREATE INDEX IF NOT EXISTS idx_safety_alerts_group_created_id ON safety_alerts(group_id, created_at DESC, id DESC);
+CREATE INDEX IF NOT EXISTS idx_safety_alerts_group_unresolved_id ON safety_alerts(group_id, created_at DESC, id DESC)
+    WHERE resolved_at IS NULL;
+
+-- Superseded by the indexes above (same leading columns)
+DROP INDEX IF EXISTS idx_safety_alerts_group_created;
+DROP INDEX IF EXISTS idx_safety_alerts_group_unresolved;
@@ -0,0 +1,8 @@
+-- Migration: Default safety_alerts.created_at to UTC (idempotent)
+-- Date: 2026-10-17
+-- Description: created_at is a TIMESTAMP without time zone that the safety
+-- service reads as UTC, and alerts now take it from the column default.
+-- CURRENT_TIMESTAMP stored there is local to the session TimeZone, so it is
+-- only UTC on UTC servers; convert explicitly.
+
+ALTER TABLE safety_alerts ALTER COLUMN created_at SET DEFAULT (now() AT TIME ZONE 'utc');
@@ -126,7 +126,7 @@ CREATE TABLE group_members (
     PRIMARY KEY (group_id, user_id)
 );
 
-CREATE INDEX idx_group_members_group ON group_members(group_id);
+-- (group_id, user_id) lookups and group_id-only scans use the primary key
 CREATE INDEX idx_group_members_user ON group_members(user_id);
 
 -- ============================================
@@ -161,13 +161,14 @@ CREATE TABLE safety_alerts (
     alert_type VARCHAR(50) DEFAULT 'help' CHECK (alert_type IN ('help', 'medical', 'harassment', 'other')),
     message TEXT,
     
-    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    created_at TIMESTAMP DEFAULT (now() AT TIME ZONE 'utc'),  -- UTC whatever the server TimeZone
     resolved_at TIMESTAMP,
     resolved_by_user_id UUID REFERENCES users(id) ON DELETE SET NULL
 );
 
-CREATE INDEX idx_safety_alerts_group ON safety_alerts(group_id);
-CREATE INDEX idx_safety_alerts_user ON safety_alerts(user_id);
+CREATE INDEX idx_safety_alerts_group_created_id ON safety_alerts(group_id, created_at DESC, id DESC);
+CREATE INDEX idx_safety_alerts_user_created ON safety_alerts(user_id, created_at DESC);
+CREATE INDEX idx_safety_alerts_group_unresolved_id ON safety_alerts(group_id, created_at DESC, id DESC) WHERE resolved_at IS NULL;
 CREATE INDEX idx_safety_alerts_created ON safety_alerts(created_at);
 CREATE INDEX idx_safety_alerts_batch ON safety_alerts(batch_id);
 
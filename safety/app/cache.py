@@ -0,0 +1,279 @@
+"""
+Redis-backed cache for hot per-request lookups.
+
+Optional: without REDIS_URL (or without the redis package) every lookup is a
+miss and callers fall back to the database.
+"""
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Optional
+from uuid import UUID
+import logging
+
+import orjson
+
+from app.config import config
+
+logger = logging.getLogger(__name__)
+
+USER_KEY_PREFIX = "safety:user:kc:"
+GROUP_KEY_PREFIX = "safety:group:"
+ALERT_LIST_KEY_PREFIX = "safety:alerts:list:"
+
+
+@dataclass(slots=True)
+class CachedUser:
+    """The User columns the safety endpoints need, detached from any session."""
+
+    id: UUID
+    keycloak_id: str
+    email: str
+    first_name: str
+    last_name: str
+    is_banned: bool = False
+
+    @classmethod
+    def from_orm(cls, user) -> "CachedUser":
+        """Copy the needed columns off a User row."""
+        return cls(
+            id=user.id,
+            keycloak_id=user.keycloak_id,
+            email=user.email,
+            first_name=user.first_name,
+            last_name=user.last_name,
+            is_banned=user.is_banned
+        )
+
+
+class UserCache:
+    """
+    keycloak_id -> CachedUser cache with a short TTL.
+
+    Only non-banned users are stored, so a ban is picked up at the latest when
+    the entry expires (USER_CACHE_TTL) and an unban takes effect immediately.
+    Bans are applied by the user service (moderation events over RabbitMQ),
+    which this service doesn't listen to, so the TTL is the only bound on a
+    stale entry and is kept to seconds. Redis errors are logged and treated
+    as misses.
+    """
+
+    def __init__(self, ttl: int):
+        self.ttl = ttl
+        self.redis_client = None
+
+    async def get(self, keycloak_id: str) -> Optional[CachedUser]:
+        """Return the cached user, or None on miss / Redis unavailable."""
+        if not self.redis_client:
+            return None
+
+        try:
+            raw = await self.redis_client.get(USER_KEY_PREFIX + keycloak_id)
+        except Exception as e:
+            logger.warning(f"User cache read failed: {e}")
+            return None
+
+        if raw is None:
+            return None
+
+        data = orjson.loads(raw)
+        data["id"] = UUID(data["id"])
+        return CachedUser(**data)
+
+    async def set(self, user: CachedUser):
+        """Cache a user for ttl seconds (banned users are never cached)."""
+        if not self.redis_client or user.is_banned:
+            return
+
+        payload = orjson.dumps({
+            "id": user.id,
+            "keycloak_id": user.keycloak_id,
+            "email": user.email,
+            "first_name": user.first_name,
+            "last_name": user.last_name
+        })
+        try:
+            await self.redis_client.set(USER_KEY_PREFIX + user.keycloak_id, payload, ex=self.ttl)
+        except Exception as e:
+            logger.warning(f"User cache write failed: {e}")
+
+
+@dataclass(slots=True)
+class EventWindow:
+    """The Event columns the alert gate evaluates (duck-types Event for is_event_active)."""
+
+    event_start: datetime
+    event_end: Optional[datetime]
+    is_cancelled: bool = False
+
+
+class GroupGateCache:
+    """
+    Per-group cache of the alert-create gate: the group's event window and its
+    known members.
+
+    The window is cached rather than an "is active" verdict, so the gate is
+    still evaluated against the current time on every hit. Members are a Redis
+    set filled lazily with positive lookups only; a non-member is never cached.
+    Both keys expire after ttl seconds, which bounds how long a removed member
+    or a cancelled event can still pass the gate.
+    """
+
+    def __init__(self, ttl: int):
+        self.ttl = ttl
+        self.redis_client = None
+
+    async def get_event_window(self, group_id: UUID) -> Optional[EventWindow]:
+        """Return the cached event window, or None on miss / Redis unavailable."""
+        if not self.redis_client:
+            return None
+
+        try:
+            raw = await self.redis_client.get(f"{GROUP_KEY_PREFIX}{group_id}:event")
+        except Exception as e:
+            logger.warning(f"Group gate cache read failed: {e}")
+            return None
+
+        if raw is None:
+            return None
+
+        data = orjson.loads(raw)
+        return EventWindow(
+            event_start=datetime.fromisoformat(data["event_start"]),
+            event_end=datetime.fromisoformat(data["event_end"]) if data["event_end"] else None,
+            is_cancelled=data["is_cancelled"]
+        )
+
+    async def set_event_window(self, group_id: UUID, window: EventWindow):
+        """Cache a group's event window for ttl seconds."""
+        if not self.redis_client:
+            return
+
+        payload = orjson.dumps({
+            "event_start": window.event_start,
+            "event_end": window.event_end,
+            "is_cancelled": bool(window.is_cancelled)
+        })
+        try:
+            await self.redis_client.set(f"{GROUP_KEY_PREFIX}{group_id}:event", payload, ex=self.ttl)
+        except Exception as e:
+            logger.warning(f"Group gate cache write failed: {e}")
+
+    async def is_member(self, group_id: UUID, user_id: UUID) -> bool:
+        """True if the user is a cached member; False means "unknown", not "not a member"."""
+        if not self.redis_client:
+            return False
+
+        try:
+            return bool(await self.redis_client.sismember(f"{GROUP_KEY_PREFIX}{group_id}:members", str(user_id)))
+        except Exception as e:
+            logger.warning(f"Group gate cache read failed: {e}")
+            return False
+
+    async def add_member(self, group_id: UUID, user_id: UUID):
+        """Record a confirmed member; the set expires ttl seconds after its first member was added."""
+        if not self.redis_client:
+            return
+
+        key = f"{GROUP_KEY_PREFIX}{group_id}:members"
+        try:
+            await self.redis_client.sadd(key, str(user_id))
+            # NX: later additions must not keep extending the set's lifetime
+            await self.redis_client.expire(key, self.ttl, nx=True)
+        except Exception as e:
+            logger.warning(f"Group gate cache write failed: {e}")
+
+
+class AlertListCache:
+    """
+    Serialized alert list pages of one group, for polling dashboards.
+
+    All pages of a group live in one Redis hash (field = filters + window), so
+    a new or (un)resolved alert drops every page of its group with a single
+    DEL. Pages hold no per-user data: callers must check group membership
+    before serving one. The hash expires ttl seconds after its first page.
+    """
+
+    def __init__(self, ttl: int):
+        self.ttl = ttl
+        self.redis_client = None
+
+    @property
+    def enabled(self) -> bool:
+        """Whether Redis is connected (lets callers skip work when it isn't)."""
+        return self.redis_client is not None
+
+    @staticmethod
+    def _field(resolved: Optional[bool], limit: int, offset: int) -> str:
+        return f"{resolved}:{limit}:{offset}"
+
+    async def get(self, group_id: UUID, resolved: Optional[bool], limit: int, offset: int) -> Optional[bytes]:
+        """Return a cached page's JSON, or None on miss / Redis unavailable."""
+        if not self.redis_client:
+            return None
+
+        try:
+            return await self.redis_client.hget(f"{ALERT_LIST_KEY_PREFIX}{group_id}", self._field(resolved, limit, offset))
+        except Exception as e:
+            logger.warning(f"Alert list cache read failed: {e}")
+            return None
+
+    async def set(self, group_id: UUID, resolved: Optional[bool], limit: int, offset: int, page: bytes):
+        """Cache a page's JSON until the group's pages expire or are invalidated."""
+        if not self.redis_client:
+            return
+
+        key = f"{ALERT_LIST_KEY_PREFIX}{group_id}"
+        try:
+            await self.redis_client.hset(key, self._field(resolved, limit, offset), page)
+            await self.redis_client.expire(key, self.ttl, nx=True)
+        except Exception as e:
+            logger.warning(f"Alert list cache write failed: {e}")
+
+    async def invalidate(self, *group_ids: UUID):
+        """Drop every cached page of the given groups."""
+        if not self.redis_client or not group_ids:
+            return
+
+        try:
+            await self.redis_client.delete(*(f"{ALERT_LIST_KEY_PREFIX}{group_id}" for group_id in group_ids))
+        except Exception as e:
+            logger.warning(f"Alert list cache invalidation failed: {e}")
+
+
+# Global cache instances, sharing one Redis connection
+user_cache = UserCache(ttl=config.USER_CACHE_TTL)
+group_gate_cache = GroupGateCache(ttl=config.GROUP_GATE_CACHE_TTL)
+alert_list_cache = AlertListCache(ttl=config.ALERT_LIST_CACHE_TTL)
+_caches = (user_cache, group_gate_cache, alert_list_cache)
+
+
+async def init_redis(url: Optional[str]):
+    """Connect the caches to Redis if configured."""
+    if not url:
+        logger.info("No REDIS_URL configured - cached lookups go to the database")
+        return
+
+    try:
+        import redis.asyncio as redis
+        client = redis.from_url(url)
+        await client.ping()
+        logger.info(f"Connected to Redis for caching: {url}")
+    except ImportError:
+        logger.warning("redis package not installed - caching disabled")
+        return
+    except Exception as e:
+        logger.error(f"Failed to connect to Redis: {e} - caching disabled")
+        return
+
+    for cache in _caches:
+        cache.redis_client = client
+
+
+async def close_redis():
+    """Close the shared Redis connection."""
+    client = user_cache.redis_client
+    for cache in _caches:
+        cache.redis_client = None
+    if client:
+        await client.close()
+        logger.info("Redis connection closed")
@@ -3,7 +3,7 @@ Configuration for Safety Service.
 Environment variables with defaults for local development.
 """
 import os
-from typing import List
+from typing import List, Optional
 
 
 class Config:
@@ -17,6 +17,10 @@ class Config:
     POSTGRES_PASSWORD: str = os.getenv("POSTGRES_PASSWORD", "crewup_dev_password")
     POSTGRES_DB: str = os.getenv("POSTGRES_DB", "crewup")
     POSTGRES_PORT: str = os.getenv("POSTGRES_PORT", "5432")
+    # Connection pool per worker: pool size + overflow should cover the threadpool
+    # (40 threads by default) so sync endpoints never queue for a connection
+    DB_POOL_SIZE: int = int(os.getenv("DB_POOL_SIZE", "20"))
+    DB_MAX_OVERFLOW: int = int(os.getenv("DB_MAX_OVERFLOW", "40"))
     
     @staticmethod
     def get_database_url() -> str:
@@ -47,11 +51,22 @@ class Config:
     )
     KEYCLOAK_REALM: str = os.getenv("KEYCLOAK_REALM", "crewup")
     KEYCLOAK_CLIENT_ID: str = os.getenv("KEYCLOAK_CLIENT_ID", "crewup-frontend")
+    KEYCLOAK_AUDIENCE: str = os.getenv("KEYCLOAK_AUDIENCE", "account")
     
     # Service URLs for inter-service communication
     GROUP_SERVICE_URL: str = os.getenv("GROUP_SERVICE_URL", "http://localhost:8002")
     EVENT_SERVICE_URL: str = os.getenv("EVENT_SERVICE_URL", "http://localhost:8001")
     
+    # Redis (optional): caches user lookups, alert gates and list pages across requests and pods
+    REDIS_URL: Optional[str] = os.getenv("REDIS_URL")
+    # Seconds a cached user is trusted; also the upper bound on how long a new ban takes
+    # to apply, so keep it short (nothing evicts a cached user when they are banned)
+    USER_CACHE_TTL: int = int(os.getenv("USER_CACHE_TTL", "10"))
+    # Seconds a group's event window and members are trusted when gating new alerts
+    GROUP_GATE_CACHE_TTL: int = int(os.getenv("GROUP_GATE_CACHE_TTL", "30"))
+    # Seconds a group's alert list pages are cached (also dropped on every create/resolve)
+    ALERT_LIST_CACHE_TTL: int = int(os.getenv("ALERT_LIST_CACHE_TTL", "15"))
+    
     # CORS
     CORS_ORIGINS: List[str] = [
         "http://localhost:5173",  # Vite dev server
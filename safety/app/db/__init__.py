@@ -2,7 +2,7 @@
 Database package.
 """
 from app.db.database import engine, SessionLocal, get_db, Base
-from app.db.models import SafetyAlert, User, Event, Group, GroupMember
+from app.db.models import SafetyAlert, User, Event, Group, GroupMember, utcnow
 
 __all__ = [
     "engine",
@@ -13,5 +13,6 @@ __all__ = [
     "User",
     "Event",
     "Group",
-    "GroupMember"
+    "GroupMember",
+    "utcnow"
 ]
@@ -25,8 +25,8 @@ else:
     engine = create_engine(
         database_url,
         pool_pre_ping=True,
-        pool_size=10,
-        max_overflow=20
+        pool_size=config.DB_POOL_SIZE,
+        max_overflow=config.DB_MAX_OVERFLOW
     )
 
 # Create session factory
@@ -1,13 +1,39 @@
 """
 Database models for Safety Service.
 """
-from sqlalchemy import Column, String, DateTime, Boolean, Integer, DECIMAL, ForeignKey, Text, ARRAY, TypeDecorator
+from sqlalchemy import Column, String, DateTime, Boolean, Integer, DECIMAL, ForeignKey, Text, ARRAY, TypeDecorator, Index, text
 from sqlalchemy.dialects.postgresql import UUID as PG_UUID
+from sqlalchemy.ext.compiler import compiles
 from sqlalchemy.orm import relationship
+from sqlalchemy.sql.functions import FunctionElement
 from datetime import datetime
 import uuid
 
 
+class utcnow(FunctionElement):
+    """
+    The database clock's current time as naive UTC, matching what the
+    application writes into TIMESTAMP (without time zone) columns.
+    
+    Plain now()/CURRENT_TIMESTAMP on PostgreSQL is converted to the session
+    TimeZone when stored in such a column, so it is only UTC on UTC servers.
+    """
+    type = DateTime()
+    inherit_cache = True
+
+
+@compiles(utcnow, "postgresql")
+def _pg_utcnow(element, compiler, **kw):
+    return "(now() AT TIME ZONE 'utc')"
+
+
+@compiles(utcnow, "sqlite")
+def _sqlite_utcnow(element, compiler, **kw):
+    # Microsecond text in SQLAlchemy's own storage format (CURRENT_TIMESTAMP has whole
+    # seconds and no fraction, so it would neither order nor compare like bound datetimes)
+    return "strftime('%Y-%m-%d %H:%M:%f000', 'now')"
+
+
 # UUID type that works with both PostgreSQL and SQLite
 class UUID(TypeDecorator):
     """Platform-independent GUID type.
@@ -124,10 +150,27 @@ class SafetyAlert(Base):
     longitude = Column(DECIMAL(11, 8))
     alert_type = Column(String(50), default="help")
     message = Column(Text)
-    created_at = Column(DateTime, default=datetime.utcnow)
+    created_at = Column(DateTime, server_default=utcnow())  # Set by the database clock (UTC)
     resolved_at = Column(DateTime)
     resolved_by_user_id = Column(UUID(), ForeignKey("users.id", ondelete="SET NULL"))
     
     user = relationship("User", foreign_keys=[user_id])
     group = relationship("Group")
     resolved_by = relationship("User", foreign_keys=[resolved_by_user_id])
+    
+    # Mirrors schema.sql / migrations 004 and 006: list queries filter by group or
+    # creator, newest first (group pages break created_at ties by id)
+    __table_args__ = (
+        Index("idx_safety_alerts_group_created_id", group_id, created_at.desc(), id.desc()),
+        Index("idx_safety_alerts_user_created", user_id, created_at.desc()),
+        Index("idx_safety_alerts_created", created_at),
+        Index("idx_safety_alerts_batch", batch_id),
+        Index(
+            "idx_safety_alerts_group_unresolved_id", group_id, created_at.desc(), id.desc(),
+            postgresql_where=text("resolved_at IS NULL"),
+            sqlite_where=text("resolved_at IS NULL"),
+        ),
+    )
+    
+    # Fetch server-generated created_at with the INSERT (RETURNING) instead of a later SELECT
+    __mapper_args__ = {"eager_defaults": True}
@@ -2,15 +2,21 @@
 Safety Service - FastAPI application.
 Emergency alert system for CrewUp events with group broadcast integration.
 """
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.exceptions import RequestValidationError
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.engine.url import make_url
 import logging
 from prometheus_fastapi_instrumentator import Instrumentator
 
 from app.config import config
+from app.cache import init_redis, close_redis
 from app.routers import alerts_router
+from app.middleware import PublicPathMiddleware
+from app.services import GroupClient
 from app.utils import (
     setup_logging,
     validation_exception_handler,
@@ -21,6 +27,29 @@ from app.utils import (
 # Setup logging
 logger = setup_logging(log_level=config.LOG_LEVEL)
 
+# Parsed once at import; only host/database are ever logged (never credentials)
+_DB_URL = make_url(config.get_database_url())
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Log startup/shutdown and own the shared group-service and Redis clients."""
+    logger.info(f"Safety Service starting on {_DB_URL.host or 'in-memory'}/{_DB_URL.database or ''}")
+    logger.info(f"Keycloak: {config.KEYCLOAK_SERVER_URL}/realms/{config.KEYCLOAK_REALM}")
+    
+    # One pooled client for all group-service calls (keep-alive across requests)
+    app.state.group_client = GroupClient.create(config.GROUP_SERVICE_URL)
+    
+    # Optional Redis caches (fall back to the database when unset)
+    await init_redis(config.REDIS_URL)
+    
+    yield
+    
+    await close_redis()
+    await app.state.group_client.aclose()
+    logger.info("Safety Service shutting down")
+
+
 # Create FastAPI app
 app = FastAPI(
     title="Safety Service",
@@ -28,7 +57,10 @@ app = FastAPI(
     version="1.0.0",
     docs_url="/api/v1/safety/docs",
     redoc_url="/api/v1/safety/redoc",
-    openapi_url="/api/v1/safety/openapi.json"
+    openapi_url="/api/v1/safety/openapi.json",
+    lifespan=lifespan,
+    # orjson renders responses (notably alert lists) much faster than the stdlib json module
+    default_response_class=ORJSONResponse
 )
 
 # CORS middleware
@@ -51,6 +83,9 @@ app.include_router(alerts_router)
 # Prometheus metrics instrumentation
 Instrumentator().instrument(app).expose(app)
 
+# Registered last so it is the outermost user middleware
+app.add_middleware(PublicPathMiddleware, router=app.router, handlers=app.exception_handlers)
+
 
 # Root endpoint
 @app.get("/")
@@ -62,18 +97,3 @@ async def root():
         "docs": "/api/v1/safety/docs"
     }
 
-
-@app.on_event("startup")
-async def startup_event():
-    """Log startup info."""
-    db_url = config.get_database_url()
-    db_info = db_url.split('@')[1] if '@' in db_url else "in-memory"
-    logger.info(f"Safety Service starting on {db_info}")
-    logger.info(f"Keycloak: {config.KEYCLOAK_SERVER_URL}/realms/{config.KEYCLOAK_REALM}")
-
-
-@app.on_event("shutdown")
-async def shutdown_event():
-    """Log shutdown."""
-    logger.info("Safety Service shutting down")
-
@@ -2,5 +2,6 @@
 Middleware package.
 """
 from app.middleware.auth import get_current_user, verify_token
+from app.middleware.public_paths import PublicPathMiddleware, PUBLIC_PATHS
 
-__all__ = ["get_current_user", "verify_token"]
+__all__ = ["get_current_user", "verify_token", "PublicPathMiddleware", "PUBLIC_PATHS"]
@@ -4,8 +4,12 @@ Authentication middleware using Keycloak.
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from jose import jwt, JWTError
+from jose.exceptions import JWTClaimsError
+from cachetools import TTLCache
 import httpx
+import hashlib
 import logging
+import threading
 from typing import Optional
 from functools import lru_cache
 import os
@@ -27,6 +31,14 @@ MOCK_TEST_USER = {
     "username": "testuser"
 }
 
+# Expected token issuer for this realm
+KEYCLOAK_ISSUER = f"{config.KEYCLOAK_SERVER_URL}/realms/{config.KEYCLOAK_REALM}"
+
+# Recently rejected tokens (sha256 digest), refused without re-verifying the signature.
+# verify_token runs in the threadpool, so access goes through a lock.
+_bad_token_cache = TTLCache(maxsize=50000, ttl=60)
+_bad_token_lock = threading.Lock()
+
 
 @lru_cache(maxsize=1)
 def get_keycloak_public_key() -> str:
@@ -63,6 +75,27 @@ def get_keycloak_public_key() -> str:
         )
 
 
+def check_unverified_claims(claims: dict) -> None:
+    """
+    Reject tokens issued for another issuer or audience.
+    
+    Runs on the unverified claims so misrouted tokens are refused before the
+    RSA signature check. Mirrors python-jose rules: a claim is only checked
+    when present.
+    
+    Raises:
+        JWTClaimsError: If issuer or audience does not match
+    """
+    if "iss" in claims and claims["iss"] != KEYCLOAK_ISSUER:
+        raise JWTClaimsError("Invalid issuer")
+    
+    if "aud" in claims:
+        audience = claims["aud"]
+        audiences = [audience] if isinstance(audience, str) else audience
+        if config.KEYCLOAK_AUDIENCE not in audiences:
+            raise JWTClaimsError("Invalid audience")
+
+
 def verify_token(credentials: Optional[HTTPAuthorizationCredentials] = Depends(security)) -> dict:
     """
     Verify JWT token and return decoded payload.
@@ -100,8 +133,21 @@ def verify_token(credentials: Optional[HTTPAuthorizationCredentials] = Depends(s
         )
     
     token = credentials.credentials
+    token_key = hashlib.sha256(token.encode()).digest()
+    
+    with _bad_token_lock:
+        known_bad = token_key in _bad_token_cache
+    if known_bad:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid or expired token",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
     
     try:
+        # Cheap claim checks before fetching the key and verifying the signature
+        check_unverified_claims(jwt.get_unverified_claims(token))
+        
         public_key = get_keycloak_public_key()
         
         # Decode and verify token
@@ -109,14 +155,16 @@ def verify_token(credentials: Optional[HTTPAuthorizationCredentials] = Depends(s
             token,
             public_key,
             algorithms=["RS256"],
-            audience="account",
-            options={"verify_aud": False}  # Keycloak uses different audience model
+            audience=config.KEYCLOAK_AUDIENCE,
+            issuer=KEYCLOAK_ISSUER
         )
         
         return payload
         
     except JWTError as e:
         logger.warning(f"JWT verification failed: {e}")
+        with _bad_token_lock:
+            _bad_token_cache[token_key] = True
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid or expired token",
@@ -0,0 +1,44 @@
+"""
+Pure ASGI gate for public (unauthenticated) paths.
+"""
+from typing import Any, Callable, Mapping
+
+from starlette.middleware.exceptions import ExceptionMiddleware
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+# Exact paths served without authentication
+PUBLIC_PATHS = frozenset({
+    "/api/v1/safety/health",
+    "/api/v1/safety/docs",
+    "/api/v1/safety/redoc",
+    "/api/v1/safety/openapi.json",
+})
+
+
+class PublicPathMiddleware:
+    """
+    Route public paths straight to the application router.
+
+    Health probes and API docs carry no credentials and need neither CORS
+    handling nor request metrics, so they skip the rest of the middleware
+    stack. The check is a single frozenset lookup on the raw ASGI scope,
+    done before any Request object is built.
+
+    The router is wrapped in its own ExceptionMiddleware with the app's
+    handlers, so errors the router raises on these paths (405 for a POST to
+    /health, say) get the same responses as on every other path. Handlers for
+    500/Exception are left to the outer ServerErrorMiddleware, as in the
+    regular stack.
+    """
+
+    def __init__(self, app: ASGIApp, router: ASGIApp, handlers: Mapping[Any, Callable]):
+        self.app = app
+        self.router = ExceptionMiddleware(router, handlers={
+            key: handler for key, handler in handlers.items() if key not in (500, Exception)
+        })
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "http" and scope["path"] in PUBLIC_PATHS:
+            await self.router(scope, receive, send)
+            return
+        await self.app(scope, receive, send)
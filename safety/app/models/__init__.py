@@ -1,7 +1,7 @@
 """
 Pydantic models for Safety Service.
 """
-from pydantic import BaseModel, Field, ConfigDict, field_validator
+from pydantic import BaseModel, Field, ConfigDict
 from typing import Optional
 from datetime import datetime
 from uuid import UUID
@@ -27,19 +27,12 @@ class SafetyAlertCreate(BaseModel):
     batch_id: Optional[UUID] = Field(None, description="Batch ID to link multiple alerts together")
     latitude: Optional[float] = Field(None, description="User's current latitude", ge=-90, le=90)
     longitude: Optional[float] = Field(None, description="User's current longitude", ge=-180, le=180)
-    alert_type: str = Field("help", description="Type of alert: help, medical, harassment, other")
+    # Enum-typed so pydantic-core validates it; use_enum_values keeps the plain string
+    alert_type: AlertType = Field(AlertType.HELP.value, description="Type of alert: help, medical, harassment, other")
     message: Optional[str] = Field(None, description="Optional message", max_length=500)
     
-    @field_validator("alert_type")
-    @classmethod
-    def validate_alert_type(cls, v: str) -> str:
-        """Validate alert type is one of the allowed values."""
-        valid_types = {t.value for t in AlertType}
-        if v not in valid_types:
-            raise ValueError(f"Invalid alert type. Must be one of: {', '.join(valid_types)}")
-        return v
-    
     model_config = ConfigDict(
+        use_enum_values=True,
         json_schema_extra={
             "example": {
                 "group_id": "123e4567-e89b-12d3-a456-426614174000",
@@ -75,10 +68,10 @@ class SafetyAlertResponse(BaseModel):
     
     model_config = ConfigDict(from_attributes=True)
     
-    @classmethod
-    def from_orm_with_user(cls, alert, user):
-        """Create response with user details."""
-        return cls(
+    @staticmethod
+    def _fields_from_orm(alert, user) -> dict:
+        """Response fields from a SafetyAlert row and its creator."""
+        return dict(
             id=alert.id,
             user_id=alert.user_id,
             group_id=alert.group_id,
@@ -95,15 +88,36 @@ class SafetyAlertResponse(BaseModel):
             user_first_name=user.first_name if user else None,
             user_last_name=user.last_name if user else None
         )
+    
+    @classmethod
+    def from_orm_with_user(cls, alert, user):
+        """Create response with user details."""
+        return cls(**cls._fields_from_orm(alert, user))
+    
+    @classmethod
+    def from_orm_fast(cls, alert, user):
+        """
+        Create response with user details, skipping validation.
+        
+        Only for rows loaded from our own DB, whose column types already match
+        the fields. Used for list pages, where per-row validation dominates.
+        """
+        return cls.model_construct(**cls._fields_from_orm(alert, user))
 
 
 class SafetyAlertListResponse(BaseModel):
-    """List of safety alerts with pagination."""
+    """
+    List of safety alerts with pagination.
+    
+    Pages are addressed by offset or, on GET /api/v1/safety, by the keyset
+    cursor of the previous page (next_cursor, None on the last page).
+    """
     
     alerts: list[SafetyAlertResponse]
     total: int
     limit: int
     offset: int
+    next_cursor: Optional[str] = None
 
 
 class ResolveAlertRequest(BaseModel):
@@ -123,7 +137,12 @@ class ResolveAlertRequest(BaseModel):
 # ==================== WebSocket Broadcast Model ====================
 
 class AlertBroadcast(BaseModel):
-    """Alert broadcast message for WebSocket."""
+    """
+    Alert broadcast message for WebSocket.
+    
+    Documents the wire format only: the payload itself is serialized directly
+    by build_alert_broadcast (app.services), never through this model.
+    """
     
     type: str = "safety_alert"
     alert_id: UUID
@@ -150,3 +169,11 @@ class AlertBroadcast(BaseModel):
             }
         }
     )
+
+
+# Build validators/serializers at import so the first request doesn't pay for it
+for _model in (SafetyAlertCreate, SafetyAlertResponse, SafetyAlertListResponse, ResolveAlertRequest, AlertBroadcast):
+    _model.model_rebuild(force=True)
+    _ = _model.__pydantic_validator__
+    _ = _model.__pydantic_serializer__
+del _model, _
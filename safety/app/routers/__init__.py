@@ -1,31 +1,38 @@
 """
 Safety alert API endpoints.
 """
-from fastapi import APIRouter, Depends, HTTPException, status, Query
-from sqlalchemy.orm import Session
-from sqlalchemy import and_
+from anyio import from_thread
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Request, Response, status, Query
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy.orm import Session, aliased, joinedload, raiseload
+from sqlalchemy import and_, func, or_, select, tuple_, update
 from typing import Optional
+from base64 import urlsafe_b64decode, urlsafe_b64encode
 from uuid import UUID, uuid4
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
+import asyncio
 import logging
-import httpx
 
-from app.db import get_db, User, SafetyAlert, Group, GroupMember, Event
+from app.db import get_db, User, SafetyAlert, Group, GroupMember, Event, utcnow
 from app.models import (
     SafetyAlertCreate,
     SafetyAlertResponse,
     SafetyAlertListResponse,
     ResolveAlertRequest,
-    AlertBroadcast,
 )
+from app.cache import CachedUser, EventWindow, alert_list_cache, group_gate_cache, user_cache
 from app.middleware import get_current_user
-from app.config import config
-from app.utils import NotFoundException, BadRequestException, ForbiddenException
+from app.services import GroupClient, build_alert_broadcast
+from app.utils import BadRequestException, NotFoundException
 
 
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/api/v1/safety", tags=["safety-alerts"])
 
+# Alerts are allowed from 2h before an event starts until 2h after it ends
+EVENT_ACTIVE_MARGIN = timedelta(hours=2)
+# Assumed length of events with no end time
+EVENT_DEFAULT_DURATION = timedelta(hours=24)
 
 @router.get("/health", include_in_schema=False, tags=["health"])
 async def health_check():
@@ -44,197 +51,293 @@ class SafetyException(HTTPException):
 
 # ==================== Helper Functions ====================
 
-async def broadcast_alert_to_group(group_id: UUID, alert: SafetyAlert, user: User) -> bool:
-    """Broadcast safety alert to group members via WebSocket (internal group service call)."""
-    try:
-        # Build user display name
-        user_name = f"{user.first_name} {user.last_name}".strip() or user.email
-        
-        # Create broadcast payload
-        broadcast_data = AlertBroadcast(
-            type="safety_alert",
-            alert_id=alert.id,
-            user_id=alert.user_id,
-            user_name=user_name,
-            alert_type=alert.alert_type,
-            message=alert.message,
-            latitude=float(alert.latitude) if alert.latitude else None,
-            longitude=float(alert.longitude) if alert.longitude else None,
-            created_at=alert.created_at
-        )
-        
-        # Call group service
-        url = f"{config.GROUP_SERVICE_URL}/api/v1/groups/internal/broadcast/{group_id}"
-        async with httpx.AsyncClient(timeout=5.0) as client:
-            response = await client.post(url, json=broadcast_data.model_dump(mode='json'))
-            response.raise_for_status()
-        
-        logger.info(f"Alert {alert.id} broadcast to group {group_id}")
-        return True
-        
-    except httpx.TimeoutException:
-        logger.error(f"Timeout broadcasting alert to group {group_id}")
-        return False
-    except httpx.HTTPError as e:
-        logger.error(f"HTTP error broadcasting alert: {e}")
-        return False
-    except Exception as e:
-        logger.error(f"Failed to broadcast alert: {e}")
-        return False
+def get_group_client(request: Request) -> GroupClient:
+    """Dependency returning the shared group-service client created in the app lifespan."""
+    return request.app.state.group_client
+
+
+def load_user(db: Session, keycloak_id: str) -> Optional[CachedUser]:
+    """Fetch the user row by keycloak_id as a detached CachedUser."""
+    user = db.query(User).filter(User.keycloak_id == keycloak_id).first()
+    return CachedUser.from_orm(user) if user else None
+
+
+async def get_current_db_user(
+    request: Request,
+    current_user: dict = Depends(get_current_user),
+    db: Session = Depends(get_db)
+) -> CachedUser:
+    """
+    Dependency resolving the authenticated caller to their user record.
+    
+    Served from the Redis user cache when possible, otherwise loaded from the
+    database (in the threadpool) and cached. Raises 404 if the profile doesn't
+    exist and 403 if the user is banned.
+    """
+    keycloak_id = current_user["keycloak_id"]
+    user = await user_cache.get(keycloak_id)
+    if user is None:
+        user = await run_in_threadpool(load_user, db, keycloak_id)
+        if not user:
+            raise NotFoundException("User profile not found")
+        await user_cache.set(user)
+    
+    if user.is_banned:
+        logger.warning(f"Banned user {user.keycloak_id} attempted {request.method} {request.url.path}")
+        raise SafetyException("User has been banned from Crewup.", status.HTTP_403_FORBIDDEN)
+    
+    return user
+
+
+def display_name(user: CachedUser) -> str:
+    """User's display name for broadcasts: "First Last", falling back to email."""
+    return f"{user.first_name} {user.last_name}".strip() or user.email
 
 
-async def broadcast_alert_resolution(group_id: UUID, alert_id: UUID, resolver_name: str) -> bool:
-    """Broadcast alert resolution to group members via WebSocket AND update message in DB."""
+# Newest first; id breaks created_at ties so pages (and keyset cursors) are stable
+ALERT_PAGE_ORDER = (SafetyAlert.created_at.desc(), SafetyAlert.id.desc())
+
+
+def paginate_alerts(query, limit: int, offset: int) -> tuple[list, int]:
+    """
+    Fetch one page of alerts (newest first) together with the total match count.
+    
+    The total comes from a COUNT(*) OVER () window column on the page query itself,
+    so rows and total share one round-trip. Only when the page is empty past the
+    first offset does it fall back to a separate COUNT.
+    """
+    rows = (
+        query.add_columns(func.count().over().label("total"))
+        .order_by(*ALERT_PAGE_ORDER)
+        .offset(offset)
+        .limit(limit)
+        .all()
+    )
+    
+    if not rows:
+        if not offset:
+            return [], 0
+        # Plain SELECT count(id) over the same joins/filters (Query.count() would wrap a subquery)
+        return [], query.with_entities(func.count(SafetyAlert.id)).scalar()
+    
+    return [alert for alert, _ in rows], rows[0].total
+
+
+def paginate_alerts_after(query, limit: int, cursor: str) -> tuple[list, int, bool]:
+    """
+    Fetch the page of alerts that follows a keyset cursor (newest first).
+    
+    Seeks straight to (created_at, id) < the cursor's key, so deep pages cost
+    the same as the first instead of scanning and discarding offset rows. The
+    total match count rides along as a scalar subquery column, and one extra
+    row is fetched to tell whether another page follows.
+    
+    Returns (alerts, total, has_more).
+    """
+    created_at, alert_id = decode_alert_cursor(cursor)
+    # correlate(None): the subquery shares the outer FROMs but must count on its own
+    total = query.with_entities(func.count(SafetyAlert.id)).statement.correlate(None).scalar_subquery()
+    rows = (
+        query.add_columns(total.label("total"))
+        .filter(tuple_(SafetyAlert.created_at, SafetyAlert.id) < (created_at, alert_id))
+        .order_by(*ALERT_PAGE_ORDER)
+        .limit(limit + 1)
+        .all()
+    )
+    
+    if not rows:
+        return [], query.with_entities(func.count(SafetyAlert.id)).scalar(), False
+    
+    return [alert for alert, _ in rows[:limit]], rows[0].total, len(rows) > limit
+
+
+def encode_alert_cursor(alert: SafetyAlert) -> str:
+    """Opaque keyset cursor for the page after this alert."""
+    return urlsafe_b64encode(f"{alert.created_at.isoformat()}|{alert.id}".encode()).decode()
+
+
+def decode_alert_cursor(cursor: str) -> tuple[datetime, UUID]:
+    """Parse a cursor from encode_alert_cursor; raises 400 if it is malformed."""
     try:
-        resolved_at = datetime.now(timezone.utc).isoformat()
-        
-        # 1. Update the message in the database
-        update_url = f"{config.GROUP_SERVICE_URL}/api/v1/groups/internal/update-alert/{group_id}/{alert_id}"
-        update_data = {
-            "resolved": True,
-            "resolved_at": resolved_at,
-            "resolved_by": resolver_name
-        }
-        
-        async with httpx.AsyncClient(timeout=5.0) as client:
-            update_response = await client.patch(update_url, json=update_data)
-            update_response.raise_for_status()
-            logger.info(f"Updated alert {alert_id} in database")
-        
-        # 2. Broadcast resolution via WebSocket
-        broadcast_data = {
-            "type": "alert_resolved",
-            "alert_id": str(alert_id),
-            "resolver_name": resolver_name,
-            "resolved_at": resolved_at
-        }
-        
-        broadcast_url = f"{config.GROUP_SERVICE_URL}/api/v1/groups/internal/broadcast/{group_id}"
-        async with httpx.AsyncClient(timeout=5.0) as client:
-            response = await client.post(broadcast_url, json=broadcast_data)
-            response.raise_for_status()
-        
-        logger.info(f"Alert {alert_id} resolution broadcast to group {group_id}")
-        return True
-        
-    except httpx.TimeoutException:
-        logger.error(f"Timeout broadcasting resolution to group {group_id}")
-        return False
-    except httpx.HTTPError as e:
-        logger.error(f"HTTP error broadcasting resolution: {e}")
-        return False
-    except Exception as e:
-        logger.error(f"Failed to broadcast resolution: {e}")
-        return False
+        created_at, alert_id = urlsafe_b64decode(cursor.encode()).decode().split("|")
+        return datetime.fromisoformat(created_at), UUID(alert_id)
+    except ValueError:
+        raise BadRequestException("Invalid pagination cursor")
+
 
+def as_utc(value: datetime) -> datetime:
+    """Treat naive datetimes as UTC (SQLite drops tzinfo); aware ones pass through."""
+    return value if value.tzinfo else value.replace(tzinfo=timezone.utc)
 
-def is_event_active(event: Event) -> bool:
+
+def is_event_active(event: Event | EventWindow) -> bool:
     """
     Check if event is currently active with 2-hour margin.
     Event is considered active from 2h before start to 2h after end.
     Handles both timezone-aware and naive datetimes for compatibility.
     """
-    now = datetime.now(timezone.utc)
+    if event.is_cancelled:
+        return False
     
-    # 2-hour margin in seconds
-    MARGIN_HOURS = 2
-    MARGIN_SECONDS = MARGIN_HOURS * 60 * 60
+    start = as_utc(event.event_start)
+    # Default end time if not specified (24h after start)
+    end = as_utc(event.event_end) if event.event_end else start + EVENT_DEFAULT_DURATION
     
-    # Ensure timezone-aware datetimes (SQLite compatibility)
-    start = event.event_start
-    if start.tzinfo is None:
-        start = start.replace(tzinfo=timezone.utc)
+    return start - EVENT_ACTIVE_MARGIN <= datetime.now(timezone.utc) <= end + EVENT_ACTIVE_MARGIN
+
+
+def load_group_gate(db: Session, group_id: UUID, user_id: UUID) -> Optional[tuple[Optional[EventWindow], bool]]:
+    """
+    Fetch the group's event window and the caller's membership in one round-trip.
     
-    end = event.event_end
-    if end and end.tzinfo is None:
-        end = end.replace(tzinfo=timezone.utc)
+    Returns None if the group doesn't exist, else (window or None if the event is gone, is_member).
+    """
+    row = (
+        db.query(Event.event_start, Event.event_end, Event.is_cancelled, GroupMember.user_id)
+        .select_from(Group)
+        .outerjoin(GroupMember, and_(GroupMember.group_id == Group.id, GroupMember.user_id == user_id))
+        .outerjoin(Event, Event.id == Group.event_id)
+        .filter(Group.id == group_id)
+        .first()
+    )
+    if not row:
+        return None
     
-    # Default end time if not specified (24h after start)
-    if not end:
-        from datetime import timedelta
-        end = start + timedelta(hours=24)
+    event_start, event_end, is_cancelled, member_id = row
+    window = EventWindow(event_start, event_end, bool(is_cancelled)) if event_start else None
+    return window, member_id is not None
+
+
+async def check_alert_gate(
+    alert_data: SafetyAlertCreate,
+    user: CachedUser = Depends(get_current_db_user),
+    db: Session = Depends(get_db)
+) -> SafetyAlertCreate:
+    """
+    Dependency allowing an alert only from a group member during the group's active event.
+    
+    Returns the request body, so the endpoint takes it from here and it is validated once.
+    
+    The event window and confirmed memberships come from the group gate cache;
+    on a miss they are loaded from the database (in the threadpool) and cached.
+    The window is always evaluated against the current time.
+    """
+    group_id = alert_data.group_id
+    window, is_member = await asyncio.gather(
+        group_gate_cache.get_event_window(group_id),
+        group_gate_cache.is_member(group_id, user.id)
+    )
+    
+    if window is None or not is_member:
+        gate = await run_in_threadpool(load_group_gate, db, group_id, user.id)
+        if gate is None:
+            raise NotFoundException("Group not found")
+        
+        window, is_member = gate
+        if window:
+            await group_gate_cache.set_event_window(group_id, window)
+        if is_member:
+            await group_gate_cache.add_member(group_id, user.id)
+    
+    if not is_member:
+        raise SafetyException("You must be a member of this group to send alerts", status.HTTP_403_FORBIDDEN)
+    if window is None:
+        raise NotFoundException("Associated event not found")
+    if not is_event_active(window):
+        raise SafetyException("Safety alerts can only be sent during active events", status.HTTP_400_BAD_REQUEST)
+    
+    return alert_data
+
+
+def is_group_member(db: Session, group_id: UUID, user_id: UUID) -> bool:
+    """Check membership with a PK lookup on group_members."""
+    return db.get(GroupMember, (group_id, user_id)) is not None
+
+
+def fetch_alert_list(
+    db: Session,
+    user_id: UUID,
+    group_id: Optional[UUID],
+    resolved: Optional[bool],
+    limit: int,
+    offset: int,
+    cursor: Optional[str] = None
+) -> SafetyAlertListResponse:
+    """One page of alerts from the user's groups, optionally narrowed to one group."""
+    # Query alerts from user's groups (creator loaded in the same SELECT, no per-row lazy load)
+    query = db.query(SafetyAlert).options(joinedload(SafetyAlert.user), raiseload("*")).join(
+        GroupMember, and_(GroupMember.group_id == SafetyAlert.group_id, GroupMember.user_id == user_id)
+    )
+    
+    # Apply filters
+    if group_id:
+        query = query.filter(SafetyAlert.group_id == group_id)
     
-    # Apply margin: 2h before start, 2h after end
-    from datetime import timedelta
-    active_start = start - timedelta(seconds=MARGIN_SECONDS)
-    active_end = end + timedelta(seconds=MARGIN_SECONDS)
+    if resolved is not None:
+        query = query.filter(
+            SafetyAlert.resolved_at.isnot(None) if resolved else SafetyAlert.resolved_at.is_(None)
+        )
+    
+    if cursor:
+        alerts, total, has_more = paginate_alerts_after(query, limit, cursor)
+    else:
+        # Fetch page and total in a single round-trip
+        alerts, total = paginate_alerts(query, limit, offset)
+        has_more = offset + len(alerts) < total
     
-    # Check: within margin window and not cancelled
-    return active_start <= now <= active_end and not event.is_cancelled
+    return SafetyAlertListResponse(
+        alerts=[SafetyAlertResponse.from_orm_fast(alert, alert.user) for alert in alerts],
+        total=total,
+        limit=limit,
+        offset=offset,
+        next_cursor=encode_alert_cursor(alerts[-1]) if has_more else None
+    )
+
+
+def invalidate_alert_lists(*group_ids: UUID) -> None:
+    """Drop cached list pages of the given groups; called from (threadpool) endpoints after commit."""
+    if alert_list_cache.enabled:
+        from_thread.run(alert_list_cache.invalidate, *group_ids)
 
 
 # ==================== API Endpoints ====================
 
 @router.post("", response_model=SafetyAlertResponse, status_code=status.HTTP_201_CREATED)
-async def create_safety_alert(
-    alert_data: SafetyAlertCreate,
-    current_user: dict = Depends(get_current_user),
-    db: Session = Depends(get_db)
+def create_safety_alert(
+    background_tasks: BackgroundTasks,
+    alert_data: SafetyAlertCreate = Depends(check_alert_gate),
+    user: CachedUser = Depends(get_current_db_user),
+    db: Session = Depends(get_db),
+    group_client: GroupClient = Depends(get_group_client)
 ):
     """Create and broadcast safety alert to group members."""
-    try:
-        # Get user profile
-        user = db.query(User).filter(User.keycloak_id == current_user["keycloak_id"]).first()
-        if not user:
-            raise SafetyException("User profile not found. Complete your profile first.", status.HTTP_404_NOT_FOUND)
-        # Check if user is banned
-        if user.is_banned:
-            logger.warning(f"Banned user {user.keycloak_id} attempted to raise a safety alert")
-            raise SafetyException("User has been banned from Crewup.", status.HTTP_403_FORBIDDEN)
-        # Validate group exists
-        group = db.query(Group).filter(Group.id == alert_data.group_id).first()
-        if not group:
-            raise NotFoundException("Group not found")
-        
-        # Check user is group member
-        is_member = db.query(GroupMember).filter(
-            and_(GroupMember.group_id == alert_data.group_id, GroupMember.user_id == user.id)
-        ).first()
-        
-        if not is_member:
-            raise SafetyException("You must be a member of this group to send alerts", status.HTTP_403_FORBIDDEN)
-        
-        # Check event is active
-        event = db.query(Event).filter(Event.id == group.event_id).first()
-        if not event:
-            raise NotFoundException("Associated event not found")
-        
-        if not is_event_active(event):
-            raise SafetyException("Safety alerts can only be sent during active events", status.HTTP_400_BAD_REQUEST)
-        
-        # Create alert
-        alert = SafetyAlert(
-            id=uuid4(),
-            user_id=user.id,
-            group_id=alert_data.group_id,
-            batch_id=alert_data.batch_id or uuid4(),  # Use provided batch_id or generate new one
-            latitude=alert_data.latitude,
-            longitude=alert_data.longitude,
-            alert_type=alert_data.alert_type,
-            message=alert_data.message,
-            created_at=datetime.now(timezone.utc)
-        )
-        
-        db.add(alert)
-        db.commit()
-        db.refresh(alert)
-        
-        logger.info(f"Alert {alert.id} created by user {user.id} in group {alert_data.group_id}")
-        
-        # Broadcast to group via WebSocket
-        await broadcast_alert_to_group(alert_data.group_id, alert, user)
-        
-        return SafetyAlertResponse.from_orm_with_user(alert, user)
-        
-    except (NotFoundException, BadRequestException, ForbiddenException, SafetyException, HTTPException):
-        raise
-    except Exception as e:
-        logger.error(f"Failed to create safety alert: {e}")
-        db.rollback()
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Failed to create safety alert"
-        )
+    # Create alert
+    alert = SafetyAlert(
+        id=uuid4(),
+        user_id=user.id,
+        group_id=alert_data.group_id,
+        batch_id=alert_data.batch_id or uuid4(),  # Use provided batch_id or generate new one
+        latitude=alert_data.latitude,
+        longitude=alert_data.longitude,
+        alert_type=alert_data.alert_type,
+        message=alert_data.message
+    )
+    
+    # The INSERT returns the database-set created_at; build everything
+    # before commit expires the alert, so no refresh SELECT is needed
+    db.add(alert)
+    db.flush()
+    payload = build_alert_broadcast(alert, display_name(user))
+    response = SafetyAlertResponse.from_orm_with_user(alert, user)
+    db.commit()
+    
+    logger.info(f"Alert {response.id} created by user {user.id} in group {alert_data.group_id}")
+    invalidate_alert_lists(alert_data.group_id)
+    
+    # Broadcast to group via WebSocket
+    background_tasks.add_task(group_client.broadcast_alert, alert_data.group_id, response.id, payload)
+    
+    return response
 
 
 @router.get("", response_model=SafetyAlertListResponse)
@@ -243,214 +346,152 @@ async def list_safety_alerts(
     resolved: Optional[bool] = Query(None, description="Filter by resolved status"),
     limit: int = Query(50, ge=1, le=100, description="Number of alerts to return"),
     offset: int = Query(0, ge=0, description="Number of alerts to skip"),
-    current_user: dict = Depends(get_current_user),
+    cursor: Optional[str] = Query(None, description="next_cursor of the previous page (instead of offset)"),
+    user: CachedUser = Depends(get_current_db_user),
     db: Session = Depends(get_db)
 ):
-    """List safety alerts (groups user is member of)."""
-    try:
-        # Get user
-        user = db.query(User).filter(User.keycloak_id == current_user["keycloak_id"]).first()
-        if not user:
-            raise NotFoundException("User profile not found")
-        
-        # Check if user is banned
-        if user.is_banned:
-            logger.warning(f"Banned user {user.keycloak_id} attempted to list the safety alerts")
-            raise SafetyException("User has been banned from Crewup.", status.HTTP_403_FORBIDDEN)
-        
-        # Query alerts from user's groups
-        query = db.query(SafetyAlert).join(
-            GroupMember, and_(GroupMember.group_id == SafetyAlert.group_id, GroupMember.user_id == user.id)
-        )
-        
-        # Apply filters
-        if group_id:
-            query = query.filter(SafetyAlert.group_id == group_id)
-        
-        if resolved is not None:
-            query = query.filter(
-                SafetyAlert.resolved_at.isnot(None) if resolved else SafetyAlert.resolved_at.is_(None)
-            )
-        
-        # Get total and fetch with pagination
-        total = query.count()
-        alerts = query.order_by(SafetyAlert.created_at.desc()).offset(offset).limit(limit).all()
-        
-        return SafetyAlertListResponse(
-            alerts=[SafetyAlertResponse.from_orm_with_user(alert, alert.user) for alert in alerts],
-            total=total,
-            limit=limit,
-            offset=offset
-        )
-        
-    except (NotFoundException, BadRequestException, ForbiddenException, SafetyException, HTTPException):
-        raise
-    except Exception as e:
-        logger.error(f"Failed to list safety alerts: {e}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Failed to list safety alerts"
-        )
+    """
+    List safety alerts (groups user is member of).
+    
+    Single-group listings are what dashboards poll, so with Redis configured
+    their pages are served from the alert list cache once the caller's
+    membership is confirmed (the cached page itself is the same for every member).
+    Cursor pages go straight to the database.
+    """
+    if cursor and offset:
+        raise BadRequestException("Use either offset or cursor, not both")
+    
+    if not group_id or cursor or not alert_list_cache.enabled:
+        return await run_in_threadpool(fetch_alert_list, db, user.id, group_id, resolved, limit, offset, cursor)
+    
+    is_member = await group_gate_cache.is_member(group_id, user.id)
+    if not is_member:
+        is_member = await run_in_threadpool(is_group_member, db, group_id, user.id)
+        if not is_member:
+            return SafetyAlertListResponse(alerts=[], total=0, limit=limit, offset=offset)
+        await group_gate_cache.add_member(group_id, user.id)
+    
+    page = await alert_list_cache.get(group_id, resolved, limit, offset)
+    if page is None:
+        alert_list = await run_in_threadpool(fetch_alert_list, db, user.id, group_id, resolved, limit, offset)
+        page = alert_list.model_dump_json().encode()
+        await alert_list_cache.set(group_id, resolved, limit, offset, page)
+    
+    return Response(content=page, media_type="application/json")
 
 
 @router.get("/my-alerts", response_model=SafetyAlertListResponse)
-async def get_my_alerts(
+def get_my_alerts(
     resolved: Optional[bool] = Query(None, description="Filter by resolved status"),
     limit: int = Query(50, ge=1, le=100, description="Number of alerts to return"),
     offset: int = Query(0, ge=0, description="Number of alerts to skip"),
-    current_user: dict = Depends(get_current_user),
+    user: CachedUser = Depends(get_current_db_user),
     db: Session = Depends(get_db)
 ):
     """Get current user's own safety alerts."""
-    try:
-        # Get user
-        user = db.query(User).filter(User.keycloak_id == current_user["keycloak_id"]).first()
-        if not user:
-            raise NotFoundException("User profile not found")
-        
-        # Check if user is banned
-        if user.is_banned:
-            logger.warning(f"Banned user {user.keycloak_id} attempted to list their safety alerts")
-            raise SafetyException("User has been banned from Crewup.", status.HTTP_403_FORBIDDEN)
-        
-        # Query alerts created by this user
-        query = db.query(SafetyAlert).filter(SafetyAlert.user_id == user.id)
-        
-        # Apply filters
-        if resolved is not None:
-            query = query.filter(
-                SafetyAlert.resolved_at.isnot(None) if resolved else SafetyAlert.resolved_at.is_(None)
-            )
-        
-        # Get total and fetch with pagination
-        total = query.count()
-        alerts = query.order_by(SafetyAlert.created_at.desc()).offset(offset).limit(limit).all()
-        
-        return SafetyAlertListResponse(
-            alerts=[SafetyAlertResponse.from_orm_with_user(alert, alert.user) for alert in alerts],
-            total=total,
-            limit=limit,
-            offset=offset
-        )
-        
-    except (NotFoundException, BadRequestException, ForbiddenException, SafetyException, HTTPException):
-        raise
-    except Exception as e:
-        logger.error(f"Failed to get user alerts: {e}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Failed to get user alerts"
+    # Query alerts created by this user (creator is `user`, so no relationship loads needed)
+    query = db.query(SafetyAlert).options(raiseload("*")).filter(SafetyAlert.user_id == user.id)
+    
+    # Apply filters
+    if resolved is not None:
+        query = query.filter(
+            SafetyAlert.resolved_at.isnot(None) if resolved else SafetyAlert.resolved_at.is_(None)
         )
+    
+    # Fetch page and total in a single round-trip
+    alerts, total = paginate_alerts(query, limit, offset)
+    
+    return SafetyAlertListResponse(
+        alerts=[SafetyAlertResponse.from_orm_fast(alert, user) for alert in alerts],
+        total=total,
+        limit=limit,
+        offset=offset
+    )
 
 
 @router.get("/{alert_id}", response_model=SafetyAlertResponse)
-async def get_safety_alert(
+def get_safety_alert(
     alert_id: UUID,
-    current_user: dict = Depends(get_current_user),
+    user: CachedUser = Depends(get_current_db_user),
     db: Session = Depends(get_db)
 ):
     """Get specific safety alert (group members only)."""
-    try:
-        # Get user
-        user = db.query(User).filter(User.keycloak_id == current_user["keycloak_id"]).first()
-        if not user:
-            raise NotFoundException("User profile not found")
-        
-        # Check if user is banned
-        if user.is_banned:
-            logger.warning(f"Banned user {user.keycloak_id} attempted to check safety alert {alert_id}")
-            raise SafetyException("User has been banned from Crewup.", status.HTTP_403_FORBIDDEN)
-        
-        # Get alert
-        alert = db.query(SafetyAlert).filter(SafetyAlert.id == alert_id).first()
-        if not alert:
-            raise NotFoundException("Alert not found")
-        
-        # Check group membership
-        is_member = db.query(GroupMember).filter(
-            and_(GroupMember.group_id == alert.group_id, GroupMember.user_id == user.id)
-        ).first()
-        
-        if not is_member:
-            raise SafetyException("Access denied: not a group member", status.HTTP_403_FORBIDDEN)
-        
-        return SafetyAlertResponse.from_orm_with_user(alert, alert.user)
-        
-    except (NotFoundException, BadRequestException, ForbiddenException, SafetyException, HTTPException):
-        raise
-    except Exception as e:
-        logger.error(f"Failed to get safety alert: {e}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Failed to get safety alert"
-        )
+    # Alert, its creator and the caller's membership in one round-trip
+    row = (
+        db.query(SafetyAlert, GroupMember.user_id)
+        .options(joinedload(SafetyAlert.user))
+        .outerjoin(GroupMember, and_(GroupMember.group_id == SafetyAlert.group_id, GroupMember.user_id == user.id))
+        .filter(SafetyAlert.id == alert_id)
+        .first()
+    )
+    if not row:
+        raise NotFoundException("Alert not found")
+    
+    alert, is_member = row
+    if not is_member:
+        raise SafetyException("Access denied: not a group member", status.HTTP_403_FORBIDDEN)
+    
+    return SafetyAlertResponse.from_orm_with_user(alert, alert.user)
 
 
 @router.patch("/{alert_id}/resolve", response_model=SafetyAlertResponse)
-async def resolve_safety_alert(
+def resolve_safety_alert(
     alert_id: UUID,
     resolve_data: ResolveAlertRequest,
-    current_user: dict = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    background_tasks: BackgroundTasks,
+    user: CachedUser = Depends(get_current_db_user),
+    db: Session = Depends(get_db),
+    group_client: GroupClient = Depends(get_group_client)
 ):
     """Mark alert as resolved (creator only). Resolves all alerts in the same batch."""
-    try:
-        # Get user
-        user = db.query(User).filter(User.keycloak_id == current_user["keycloak_id"]).first()
-        if not user:
-            raise NotFoundException("User profile not found")
-        
-        # Check if user is banned
-        if user.is_banned:
-            logger.warning(f"Banned user {user.keycloak_id} attempted to resolve safety alert {alert_id}")
-            raise SafetyException("User has been banned from Crewup.", status.HTTP_403_FORBIDDEN)
-        
-        # Get alert
-        alert = db.query(SafetyAlert).filter(SafetyAlert.id == alert_id).first()
-        if not alert:
-            raise NotFoundException("Alert not found")
-        
-        # Check permissions (creator only)
-        is_creator = alert.user_id == user.id
-        
-        if not is_creator:
-            raise SafetyException("Access denied: only the alert creator can resolve it", status.HTTP_403_FORBIDDEN)
-        
-        # Get all alerts in the same batch
-        batch_id = alert.batch_id or alert.id
-        batch_alerts = db.query(SafetyAlert).filter(SafetyAlert.batch_id == batch_id).all()
-        
-        # Update all alerts in the batch
-        resolver_name = f"{user.first_name} {user.last_name}".strip() or user.email
-        resolved_time = datetime.now(timezone.utc) if resolve_data.resolved else None
-        
-        for batch_alert in batch_alerts:
-            batch_alert.resolved_at = resolved_time
-            batch_alert.resolved_by_user_id = user.id if resolve_data.resolved else None
-        
-        db.commit()
-        
-        # Refresh the original alert
-        db.refresh(alert)
-        
-        logger.info(f"Alert batch {batch_id} ({'resolved' if resolve_data.resolved else 'unresolved'}) by user {user.id} - {len(batch_alerts)} alerts updated")
-        
-        # Broadcast resolution to all groups in the batch
-        if resolve_data.resolved:
-            for batch_alert in batch_alerts:
-                await broadcast_alert_resolution(batch_alert.group_id, batch_alert.id, resolver_name)
-        
-        return SafetyAlertResponse.from_orm_with_user(alert, alert.user)
-        
-    except (NotFoundException, BadRequestException, ForbiddenException, SafetyException, HTTPException):
-        raise
-    except Exception as e:
-        logger.error(f"Failed to resolve alert: {e}")
-        db.rollback()
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Failed to resolve alert"
+    # One UPDATE ... RETURNING: the creator check is part of the WHERE clause, and the
+    # batch is every alert of this creator sharing the target's batch_id (or just the
+    # target for pre-batch rows). Aliased so the subquery doesn't correlate to the UPDATE.
+    target = aliased(SafetyAlert)
+    target_batch = (
+        select(target.batch_id)
+        .where(target.id == alert_id, target.user_id == user.id)
+        .scalar_subquery()
+    )
+    updated_alerts = db.execute(
+        update(SafetyAlert)
+        .where(
+            SafetyAlert.user_id == user.id,
+            or_(SafetyAlert.id == alert_id, SafetyAlert.batch_id == target_batch)
+        )
+        .values(
+            resolved_at=utcnow() if resolve_data.resolved else None,
+            resolved_by_user_id=user.id if resolve_data.resolved else None
         )
+        .returning(SafetyAlert)
+    ).scalars().all()
+    
+    if not updated_alerts:
+        # Rare failure path: tell a missing alert apart from someone else's
+        if db.get(SafetyAlert, alert_id) is None:
+            raise NotFoundException("Alert not found")
+        raise SafetyException("Access denied: only the alert creator can resolve it", status.HTTP_403_FORBIDDEN)
+    
+    alert = next(a for a in updated_alerts if a.id == alert_id)
+    batch_id = alert.batch_id or alert.id
+    targets = [(a.group_id, a.id) for a in updated_alerts]
+    resolver_name = display_name(user)
+    # The stored time (shared by the whole batch), so chat messages match the rows
+    resolved_at = as_utc(alert.resolved_at) if resolve_data.resolved else None
+    
+    # The creator filter guarantees alert.user is user; built before commit expires the alert
+    response = SafetyAlertResponse.from_orm_with_user(alert, user)
+    
+    db.commit()
+    
+    logger.info(f"Alert batch {batch_id} ({'resolved' if resolve_data.resolved else 'unresolved'}) by user {user.id} - {len(updated_alerts)} alerts updated")
+    invalidate_alert_lists(*{group_id for group_id, _ in targets})
+    
+    # Broadcast resolution to all groups in the batch
+    if resolve_data.resolved:
+        background_tasks.add_task(group_client.broadcast_batch_resolution, targets, resolver_name, resolved_at)
+    
+    return response
 
 
 # Export router
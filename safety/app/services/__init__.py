@@ -0,0 +1,4 @@
+"""Services package for outbound integrations."""
+from app.services.group_client import GroupClient, build_alert_broadcast
+
+__all__ = ["GroupClient", "build_alert_broadcast"]
@@ -0,0 +1,206 @@
+"""
+Client for the group service internal API.
+
+Safety alerts and their resolutions are pushed to group members through the
+group service, which stores them in the chat history and relays them over
+WebSocket.
+"""
+from datetime import datetime, timezone
+from typing import Awaitable, Callable, Optional
+from uuid import UUID
+import asyncio
+import logging
+
+import httpx
+import orjson
+
+from app.db import SafetyAlert
+
+logger = logging.getLogger(__name__)
+
+# Broadcast payloads are pre-serialized, so httpx must be told the body type
+JSON_HEADERS = {"content-type": "application/json"}
+
+# Max concurrent group-service calls when broadcasting a batch
+BROADCAST_CONCURRENCY = 10
+
+
+def build_alert_broadcast(alert: SafetyAlert, user_name: str) -> bytes:
+    """
+    Serialize the safety_alert broadcast payload (same shape as AlertBroadcast).
+
+    Built by hand from our own freshly-committed row, so no model validation is
+    needed on the outbound path; orjson writes UUIDs and datetimes natively.
+    Called in the handler, while the session is open. created_at is set by the
+    database as naive UTC and is sent with an explicit UTC offset.
+    """
+    return orjson.dumps({
+        "type": "safety_alert",
+        "alert_id": alert.id,
+        "user_id": alert.user_id,
+        "user_name": user_name,
+        "alert_type": alert.alert_type,
+        "message": alert.message,
+        "latitude": float(alert.latitude) if alert.latitude else None,
+        "longitude": float(alert.longitude) if alert.longitude else None,
+        "created_at": alert.created_at
+    }, option=orjson.OPT_NAIVE_UTC)
+
+
+class GroupClient:
+    """
+    Group service internal API client.
+
+    Wraps one pooled httpx.AsyncClient for the whole app lifetime, so every
+    broadcast reuses keep-alive connections instead of paying a new TCP
+    handshake and pool teardown per call.
+    """
+
+    def __init__(self, client: httpx.AsyncClient):
+        """
+        Initialize with a shared client.
+
+        Args:
+            client: AsyncClient whose base_url points at the group service
+        """
+        self._client = client
+
+    @classmethod
+    def create(cls, base_url: str) -> "GroupClient":
+        """Build a client with pooled connections tuned for short internal calls."""
+        return cls(httpx.AsyncClient(
+            base_url=base_url,
+            timeout=httpx.Timeout(5.0, connect=1.0),
+            limits=httpx.Limits(max_keepalive_connections=40, max_connections=100, keepalive_expiry=30),
+        ))
+
+    async def aclose(self) -> None:
+        """Close the underlying connection pool."""
+        await self._client.aclose()
+
+    async def broadcast_alert(self, group_id: UUID, alert_id: UUID, payload: bytes) -> bool:
+        """Broadcast a pre-serialized safety alert to group members via WebSocket."""
+        try:
+            url = f"/api/v1/groups/internal/broadcast/{group_id}"
+            response = await self._client.post(url, content=payload, headers=JSON_HEADERS)
+            response.raise_for_status()
+
+            logger.info(f"Alert {alert_id} broadcast to group {group_id}")
+            return True
+
+        except httpx.TimeoutException:
+            logger.error(f"Timeout broadcasting alert to group {group_id}")
+            return False
+        except httpx.HTTPError as e:
+            logger.error(f"HTTP error broadcasting alert: {e}")
+            return False
+        except Exception as e:
+            logger.error(f"Failed to broadcast alert: {e}")
+            return False
+
+    @staticmethod
+    def _resolution_update_body(resolver_name: str, resolved_at: datetime) -> bytes:
+        """PATCH body marking a stored alert message resolved; identical for every alert in a batch."""
+        return orjson.dumps({
+            "resolved": True,
+            "resolved_at": resolved_at,
+            "resolved_by": resolver_name
+        })
+
+    async def broadcast_resolution(
+        self,
+        group_id: UUID,
+        alert_id: UUID,
+        resolver_name: str,
+        resolved_at: Optional[datetime] = None,
+        update_body: Optional[bytes] = None
+    ) -> bool:
+        """
+        Broadcast alert resolution to group members via WebSocket AND update message in DB.
+
+        Batch callers pass resolved_at and the pre-serialized update_body so they are built once.
+        """
+        resolved_at = resolved_at or datetime.now(timezone.utc)
+
+        # 1. Update the message in the database
+        update_url = f"/api/v1/groups/internal/update-alert/{group_id}/{alert_id}"
+        update_body = update_body or self._resolution_update_body(resolver_name, resolved_at)
+
+        # 2. Broadcast resolution via WebSocket
+        broadcast_url = f"/api/v1/groups/internal/broadcast/{group_id}"
+        broadcast_body = orjson.dumps({
+            "type": "alert_resolved",
+            "alert_id": alert_id,
+            "resolver_name": resolver_name,
+            "resolved_at": resolved_at
+        })
+
+        # Both calls are independent: run them concurrently, one failure doesn't cancel the other
+        update_response, broadcast_response = await asyncio.gather(
+            self._client.patch(update_url, content=update_body, headers=JSON_HEADERS),
+            self._client.post(broadcast_url, content=broadcast_body, headers=JSON_HEADERS),
+            return_exceptions=True
+        )
+
+        success = True
+        for action, response in (("update", update_response), ("broadcast", broadcast_response)):
+            try:
+                if isinstance(response, BaseException):
+                    raise response
+                response.raise_for_status()
+            except httpx.TimeoutException:
+                logger.error(f"Timeout on resolution {action} for group {group_id}")
+                success = False
+            except httpx.HTTPError as e:
+                logger.error(f"HTTP error on resolution {action}: {e}")
+                success = False
+            except Exception as e:
+                logger.error(f"Failed resolution {action}: {e}")
+                success = False
+
+        if success:
+            logger.info(f"Alert {alert_id} resolution broadcast to group {group_id}")
+        return success
+
+    async def broadcast_batch_resolution(self, targets: list, resolver_name: str, resolved_at: datetime) -> int:
+        """
+        Broadcast resolution of every alert in a batch concurrently.
+
+        targets holds plain (group_id, alert_id) pairs so this can run after the DB session is closed;
+        resolved_at is the time stored on the rows. Returns how many were delivered.
+        """
+        update_body = self._resolution_update_body(resolver_name, resolved_at)
+        return await self._fan_out(
+            "resolution",
+            targets,
+            lambda group_id, alert_id: self.broadcast_resolution(
+                group_id, alert_id, resolver_name, resolved_at=resolved_at, update_body=update_body
+            )
+        )
+
+    async def _fan_out(self, action: str, targets: list, call: Callable[..., Awaitable[bool]]) -> int:
+        """
+        Run call(*target) for every target, at most BROADCAST_CONCURRENCY at a time.
+
+        Each target is a (group_id, alert_id) pair.
+        """
+        sem = asyncio.Semaphore(BROADCAST_CONCURRENCY)
+
+        async def _bounded(target: tuple) -> bool:
+            async with sem:
+                return await call(*target)
+
+        results = await asyncio.gather(*(_bounded(target) for target in targets), return_exceptions=True)
+
+        delivered = 0
+        for (group_id, alert_id), result in zip(targets, results):
+            if isinstance(result, BaseException):
+                logger.error(f"Failed to broadcast {action} of alert {alert_id} to group {group_id}: {result}")
+            elif not result:
+                logger.warning(f"{action.capitalize()} of alert {alert_id} not delivered to group {group_id}")
+            else:
+                delivered += 1
+
+        if len(targets) > 1:
+            logger.info(f"Broadcast {action} fan-out: {delivered}/{len(targets)} delivered")
+        return delivered
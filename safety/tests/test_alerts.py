@@ -1,13 +1,16 @@
 """
 Simple tests for Safety Alert API - with dependency overrides.
 """
+import json
 import pytest
 from fastapi import status
 from unittest.mock import patch, AsyncMock
 from uuid import uuid4
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
 
-from app.db import SafetyAlert
+from app.db import SafetyAlert, User
+from app.main import app
+from app.routers import as_utc
 
 
 def test_health_check(client):
@@ -42,23 +45,10 @@ def test_create_safety_alert_success(client, db_session, mock_user, mock_group,
     assert data["message"] == "Need assistance"
 
 
-def test_list_alerts_success(client, db_session, mock_user, mock_group, mock_group_member):
+def test_list_alerts_success(client, make_alerts, mock_group_member):
     """Test listing alerts."""
     # Create some alerts
-    alert1 = SafetyAlert(
-    user_id=mock_user.id,
-    group_id=mock_group.id,
-    alert_type="help",
-    message="Test alert 1"
-    )
-    alert2 = SafetyAlert(
-    user_id=mock_user.id,
-    group_id=mock_group.id,
-    alert_type="emergency",
-    message="Test alert 2"
-    )
-    db_session.add_all([alert1, alert2])
-    db_session.commit()
+    make_alerts(2)
 
     response = client.get(
     "/api/v1/safety",
@@ -82,8 +72,7 @@ def test_get_alert_success(client, db_session, mock_user, mock_group, mock_group
     longitude=22.1
     )
     db_session.add(alert)
-    db_session.commit()
-    db_session.refresh(alert)
+    db_session.flush()
 
     response = client.get(
     f"/api/v1/safety/{alert.id}",
@@ -98,7 +87,6 @@ def test_get_alert_success(client, db_session, mock_user, mock_group, mock_group
 
 def test_resolve_alert(client, db_session, mock_user, mock_group, mock_group_member):
     """Test resolving an alert."""
-    from uuid import uuid4
     batch_id = uuid4()
     alert = SafetyAlert(
     user_id=mock_user.id,
@@ -107,8 +95,7 @@ def test_resolve_alert(client, db_session, mock_user, mock_group, mock_group_mem
     batch_id=batch_id
     )
     db_session.add(alert)
-    db_session.commit()
-    db_session.refresh(alert)
+    db_session.flush()
 
     response = client.patch(
     f"/api/v1/safety/{alert.id}/resolve",
@@ -121,7 +108,7 @@ def test_resolve_alert(client, db_session, mock_user, mock_group, mock_group_mem
     assert data["resolved_at"] is not None
 
 
-def test_get_my_alerts_success(client, db_session, mock_user, mock_group, mock_group_member):
+def test_get_my_alerts_success(client, db_session, mock_user, mock_group, mock_group_member, now):
     """Test getting current user's own alerts."""
     # Create alerts for the current user
     alert1 = SafetyAlert(
@@ -135,7 +122,7 @@ def test_get_my_alerts_success(client, db_session, mock_user, mock_group, mock_g
         group_id=mock_group.id,
         alert_type="medical",
         message="My alert 2",
-        resolved_at=datetime.utcnow()
+        resolved_at=now
     )
     db_session.add_all([alert1, alert2])
     db_session.commit()
@@ -170,3 +157,233 @@ def test_get_my_alerts_success(client, db_session, mock_user, mock_group, mock_g
     assert response.status_code == status.HTTP_200_OK
     data = response.json()
     assert all(alert["is_resolved"] for alert in data["alerts"])
+
+
+def test_list_alerts_loads_creators_without_n_plus_one(client, db_session, record_statements, mock_user, mock_group, mock_group_member):
+    """Listing alerts from several creators issues a fixed number of queries."""
+
+    for i in range(3):
+        author = User(id=uuid4(), keycloak_id=f"author-{i}", email=f"author{i}@example.com", first_name="Author", last_name=str(i))
+        db_session.add(author)
+        db_session.add(SafetyAlert(user_id=author.id, group_id=mock_group.id, alert_type="help"))
+    db_session.commit()
+    db_session.expunge_all()
+
+    with record_statements() as statements:
+        response = client.get("/api/v1/safety", headers={"Authorization": "Bearer mock-token"})
+
+    assert response.status_code == status.HTTP_200_OK
+    data = response.json()
+    assert {a["user_email"] for a in data["alerts"]} == {f"author{i}@example.com" for i in range(3)}
+    # user lookup + page (total comes from a window column); no per-row user SELECT
+    assert statements.verbs == ["SELECT", "SELECT"]
+
+
+def test_list_alerts_group_pages_use_index(client, db_session, record_statements, make_alerts, mock_group_member):
+    """Group pages are read through the (group_id, created_at, id) index."""
+    make_alerts(3)
+    url = f"/api/v1/safety?group_id={mock_group_member.group_id}&limit=2"
+    with record_statements() as statements:
+        response = client.get(url)
+        client.get(f"{url}&cursor={response.json()['next_cursor']}")
+
+    plans = [
+        " | ".join(row[-1] for row in db_session.connection().exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters))
+        for statement, parameters in statements
+        if "FROM safety_alerts" in statement
+    ]
+    assert len(plans) == 2
+    assert all("idx_safety_alerts_group_created_id" in plan for plan in plans)
+    # The cursor page seeks and reads in index order. (SQLite re-sorts the offset
+    # page after materializing its COUNT(*) OVER () window; PostgreSQL doesn't.)
+    assert "TEMP B-TREE" not in plans[1], plans[1]
+
+
+def test_list_alerts_pagination_total(client, make_alerts, mock_group_member):
+    """Total counts every match, including when the page is partial or past the end."""
+    make_alerts(5)
+
+    for offset, expected_len in ((0, 2), (4, 1), (10, 0)):
+        response = client.get(
+            f"/api/v1/safety?limit=2&offset={offset}",
+            headers={"Authorization": "Bearer mock-token"}
+        )
+        assert response.status_code == status.HTTP_200_OK
+        data = response.json()
+        assert len(data["alerts"]) == expected_len
+        assert data["total"] == 5
+
+
+def test_resolve_alert_resolves_whole_batch(client, db_session, mock_user, mock_group, mock_group_member):
+    """Resolving one alert resolves every alert sharing its batch_id, and nothing else."""
+    batch_id = uuid4()
+    batch = [
+        SafetyAlert(user_id=mock_user.id, group_id=mock_group.id, alert_type="help", batch_id=batch_id)
+        for _ in range(3)
+    ]
+    other = SafetyAlert(user_id=mock_user.id, group_id=mock_group.id, alert_type="help", batch_id=uuid4())
+    db_session.add_all(batch + [other])
+    db_session.commit()
+
+    with patch.object(app.state.group_client, "broadcast_batch_resolution", new_callable=AsyncMock) as mock_broadcast:
+        response = client.patch(
+            f"/api/v1/safety/{batch[0].id}/resolve",
+            json={"resolved": True},
+            headers={"Authorization": "Bearer mock-token"}
+        )
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json()["is_resolved"] is True
+
+    db_session.expire_all()
+    assert all(alert.resolved_at is not None for alert in batch)
+    assert all(alert.resolved_by_user_id == mock_user.id for alert in batch)
+    assert other.resolved_at is None
+    # Chat messages carry the stored resolution time (UTC), not a second clock reading
+    assert {alert.resolved_at for alert in batch} == {batch[0].resolved_at}
+    assert mock_broadcast.await_args.args[2] == as_utc(batch[0].resolved_at)
+
+
+def test_resolve_batch_skips_other_users_alerts(client, db_session, mock_user, mock_group, mock_group_member):
+    """A batch_id reused by another user doesn't let either creator resolve the other's alerts."""
+
+    other = User(id=uuid4(), keycloak_id="other-kc", email="other@example.com", first_name="Other", last_name="User")
+    batch_id = uuid4()
+    own_alert = SafetyAlert(user_id=mock_user.id, group_id=mock_group.id, alert_type="help", batch_id=batch_id)
+    other_alert = SafetyAlert(user_id=other.id, group_id=mock_group.id, alert_type="help", batch_id=batch_id)
+    db_session.add_all([other, own_alert, other_alert])
+    db_session.commit()
+
+    response = client.patch(
+        f"/api/v1/safety/{own_alert.id}/resolve",
+        json={"resolved": True},
+        headers={"Authorization": "Bearer mock-token"}
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    db_session.expire_all()
+    assert own_alert.resolved_at is not None
+    assert other_alert.resolved_at is None
+
+
+def test_resolve_and_unresolve_alert_without_batch(client, db_session, mock_user, mock_group, mock_group_member):
+    """An alert with no batch_id can be resolved and unresolved on its own."""
+    alert = SafetyAlert(user_id=mock_user.id, group_id=mock_group.id, alert_type="help")
+    db_session.add(alert)
+    db_session.commit()
+
+    for resolved in (True, False):
+        response = client.patch(
+            f"/api/v1/safety/{alert.id}/resolve",
+            json={"resolved": resolved},
+            headers={"Authorization": "Bearer mock-token"}
+        )
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json()["is_resolved"] is resolved
+
+        db_session.expire_all()
+        assert (alert.resolved_at is not None) is resolved
+
+
+def test_resolve_alert_round_trips(client, db_session, record_statements, mock_user, mock_group, mock_group_member):
+    """A creator resolve is a single UPDATE ... RETURNING; only a rejected one looks the alert up."""
+
+    other = User(id=uuid4(), keycloak_id="other-kc", email="other@example.com", first_name="Other", last_name="User")
+    own_alert = SafetyAlert(user_id=mock_user.id, group_id=mock_group.id, alert_type="help")
+    other_alert = SafetyAlert(user_id=other.id, group_id=mock_group.id, alert_type="help")
+    db_session.add_all([other, own_alert, other_alert])
+    db_session.commit()
+    own_alert_id, other_alert_id = own_alert.id, other_alert.id
+    # Like a real request, start without the alerts in the session's identity map
+    db_session.expunge_all()
+
+    with record_statements() as statements:
+        response = client.patch(
+            f"/api/v1/safety/{other_alert_id}/resolve",
+            json={"resolved": True},
+            headers={"Authorization": "Bearer mock-token"}
+        )
+    assert response.status_code == status.HTTP_403_FORBIDDEN
+    # user lookup + guarded UPDATE (no rows) + alert lookup to pick 403 over 404
+    assert statements.verbs == ["SELECT", "UPDATE", "SELECT"]
+
+    with record_statements() as statements:
+        response = client.patch(
+            f"/api/v1/safety/{own_alert_id}/resolve",
+            json={"resolved": True},
+            headers={"Authorization": "Bearer mock-token"}
+        )
+    assert response.status_code == status.HTTP_200_OK
+    # user lookup + UPDATE ... RETURNING; no alert, membership or batch SELECT
+    assert statements.verbs == ["SELECT", "UPDATE"]
+
+
+def test_get_alert_not_group_member(client, db_session, mock_user, mock_group):
+    """Non-members get 403 for an existing alert and 404 for a missing one."""
+    alert = SafetyAlert(user_id=mock_user.id, group_id=mock_group.id, alert_type="help")
+    db_session.add(alert)
+    db_session.commit()
+
+    response = client.get(f"/api/v1/safety/{alert.id}", headers={"Authorization": "Bearer mock-token"})
+    assert response.status_code == status.HTTP_403_FORBIDDEN
+
+    response = client.get(f"/api/v1/safety/{uuid4()}", headers={"Authorization": "Bearer mock-token"})
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+
+
+def test_create_alert_takes_created_at_from_insert(client, db_session, record_statements, mock_user, mock_group, mock_group_member):
+    """created_at is set by the database and returned by the INSERT, with no refresh SELECT."""
+
+    group_id = str(mock_group.id)
+    with record_statements() as statements, \
+         patch.object(app.state.group_client, "broadcast_alert", new_callable=AsyncMock):
+        response = client.post(
+            "/api/v1/safety",
+            json={"group_id": group_id, "alert_type": "help"},
+            headers={"Authorization": "Bearer mock-token"}
+        )
+
+    assert response.status_code == status.HTTP_201_CREATED
+    created_at = datetime.fromisoformat(response.json()["created_at"])
+    # The database clock, in UTC like every other timestamp the service writes
+    assert abs(as_utc(created_at) - datetime.now(timezone.utc)) < timedelta(minutes=1)
+    # user lookup + gate query + INSERT ... RETURNING
+    assert statements.verbs == ["SELECT", "SELECT", "INSERT"]
+
+
+def test_create_alert_schedules_broadcast(client, db_session, mock_user, mock_group, mock_group_member):
+    """The broadcast runs as a background task with the pre-built payload."""
+
+    with patch.object(app.state.group_client, "broadcast_alert", new_callable=AsyncMock) as mock_broadcast:
+        response = client.post(
+            "/api/v1/safety",
+            json={"group_id": str(mock_group.id), "alert_type": "medical", "message": "Hurt"},
+            headers={"Authorization": "Bearer mock-token"}
+        )
+
+    assert response.status_code == status.HTTP_201_CREATED
+    alert_id = response.json()["id"]
+
+    mock_broadcast.assert_awaited_once()
+    group_id, broadcast_alert_id, payload = mock_broadcast.await_args.args
+    assert str(group_id) == str(mock_group.id)
+    assert str(broadcast_alert_id) == alert_id
+    body = json.loads(payload)
+    assert body["type"] == "safety_alert"
+    assert body["alert_id"] == alert_id
+    assert body["user_name"] == "Test User"
+
+
+def test_get_my_alerts_pagination_total(client, make_alerts, mock_group_member):
+    """my-alerts reports the full total alongside each page, including past the end."""
+    make_alerts(3)
+
+    for offset, expected_len in ((0, 2), (2, 1), (5, 0)):
+        response = client.get(
+            f"/api/v1/safety/my-alerts?limit=2&offset={offset}",
+            headers={"Authorization": "Bearer mock-token"}
+        )
+        assert response.status_code == status.HTTP_200_OK
+        data = response.json()
+        assert len(data["alerts"]) == expected_len
+        assert data["total"] == 3
@@ -6,6 +6,8 @@ from fastapi import status
 from uuid import uuid4
 from datetime import datetime, timezone
 
+from app.db import SafetyAlert
+
 
 class TestHealthEndpoint:
     """Test health check endpoint."""
@@ -18,37 +20,47 @@ class TestHealthEndpoint:
         assert data["status"] == "healthy"
         assert data["service"] == "safety-service"
 
+    def test_health_check_skips_middleware_stack(self, client):
+        """Public paths are routed directly, without CORS handling."""
+        origin = {"Origin": "http://localhost:5173"}
+        health = client.get("/api/v1/safety/health", headers=origin)
+        assert health.status_code == status.HTTP_200_OK
+        assert "access-control-allow-origin" not in health.headers
+
+        alerts = client.get("/api/v1/safety", headers=origin)
+        assert alerts.headers["access-control-allow-origin"] == origin["Origin"]
+
+    @pytest.mark.parametrize("path", ["/api/v1/safety/health", "/api/v1/safety/openapi.json"])
+    def test_public_path_wrong_method(self, unauth_client, path):
+        """Router errors on public paths keep their status (405), not a 500."""
+        response = unauth_client.post(path)
+        assert response.status_code == status.HTTP_405_METHOD_NOT_ALLOWED
+
+    def test_openapi_schema_is_public(self, unauth_client):
+        """OpenAPI schema is served without credentials."""
+        response = unauth_client.get("/api/v1/safety/openapi.json")
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json()["info"]["title"] == "Safety Service"
+
 
 class TestAuthentication:
     """Test authentication requirements."""
 
-    def test_create_alert_unauthorized(self, unauth_client):
-        """Creating alert without auth should return 401."""
-        response = unauth_client.post(
-            "/api/v1/safety",
-            json={
-                "group_id": str(uuid4()),
-                "latitude": 65.584819,
-                "longitude": 22.154984,
-                "alert_type": "help",
-                "message": "Test"
-            }
-        )
-        assert response.status_code == status.HTTP_401_UNAUTHORIZED
-
-    def test_list_alerts_unauthorized(self, unauth_client):
-        """Listing alerts without auth should return 401."""
-        response = unauth_client.get("/api/v1/safety")
-        assert response.status_code == status.HTTP_401_UNAUTHORIZED
-
-    def test_get_alert_unauthorized(self, unauth_client):
-        """Getting alert without auth should return 401."""
-        response = unauth_client.get(f"/api/v1/safety/{uuid4()}")
-        assert response.status_code == status.HTTP_401_UNAUTHORIZED
-
-    def test_resolve_alert_unauthorized(self, unauth_client):
-        """Resolving alert without auth should return 401."""
-        response = unauth_client.patch(f"/api/v1/safety/{uuid4()}/resolve")
+    @pytest.mark.parametrize("method,path,body", [
+        ("post", "/api/v1/safety", {
+            "group_id": str(uuid4()),
+            "latitude": 65.584819,
+            "longitude": 22.154984,
+            "alert_type": "help",
+            "message": "Test"
+        }),
+        ("get", "/api/v1/safety", None),
+        ("get", f"/api/v1/safety/{uuid4()}", None),
+        ("patch", f"/api/v1/safety/{uuid4()}/resolve", None),
+    ], ids=["create", "list", "get", "resolve"])
+    def test_requires_auth(self, unauth_client, method, path, body):
+        """Every alert endpoint returns 401 without a token."""
+        response = unauth_client.request(method, path, json=body)
         assert response.status_code == status.HTTP_401_UNAUTHORIZED
 
 
@@ -128,6 +140,8 @@ class TestCreateAlert:
 
         # Pydantic validation error returns 422
         assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+        details = response.json()["error"]["details"]
+        assert [d["field"] for d in details] == ["body.alert_type"]
 
     def test_create_alert_invalid_coordinates(self, client, mock_user, mock_group, mock_group_member, mock_current_user):
         """Test creating alert with invalid coordinates."""
@@ -204,7 +218,6 @@ class TestGetAlert:
     def test_get_alert_success(self, client, mock_user, mock_group, mock_group_member, mock_current_user, db_session):
         """Test getting a specific alert."""
         # First create an alert
-        from app.db import SafetyAlert
         alert = SafetyAlert(
             user_id=mock_user.id,
             group_id=mock_group.id,
@@ -214,8 +227,7 @@ class TestGetAlert:
             message="Test alert"
         )
         db_session.add(alert)
-        db_session.commit()
-        db_session.refresh(alert)
+        db_session.flush()
 
         response = client.get(
             f"/api/v1/safety/{alert.id}",
@@ -244,8 +256,6 @@ class TestResolveAlert:
 
     def test_resolve_alert_success(self, client, mock_user, mock_group, mock_group_member, mock_current_user, db_session):
         """Test resolving an alert."""
-        from app.db import SafetyAlert
-        from uuid import uuid4
         batch_id = uuid4()
         alert = SafetyAlert(
             user_id=mock_user.id,
@@ -256,8 +266,7 @@ class TestResolveAlert:
             batch_id=batch_id
         )
         db_session.add(alert)
-        db_session.commit()
-        db_session.refresh(alert)
+        db_session.flush()
 
         response = client.patch(
             f"/api/v1/safety/{alert.id}/resolve",
@@ -272,7 +281,6 @@ class TestResolveAlert:
 
     def test_resolve_alert_already_resolved(self, client, mock_user, mock_group, mock_group_member, mock_current_user, db_session):
         """Test resolving an already resolved alert."""
-        from app.db import SafetyAlert
         alert = SafetyAlert(
             user_id=mock_user.id,
             group_id=mock_group.id,
@@ -282,8 +290,7 @@ class TestResolveAlert:
             resolved_at=datetime.now(timezone.utc)
         )
         db_session.add(alert)
-        db_session.commit()
-        db_session.refresh(alert)
+        db_session.flush()
 
         response = client.patch(
             f"/api/v1/safety/{alert.id}/resolve",
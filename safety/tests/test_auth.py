@@ -1,75 +1,96 @@
 """Tests for authentication middleware."""
 import pytest
+from types import SimpleNamespace
 from unittest.mock import patch, MagicMock
 from fastapi import HTTPException
-from jose import jwt
+from jose import JWTError, jwt
 from fastapi.security import HTTPAuthorizationCredentials
 
+from app.config import config
+from app.middleware.auth import (
+    KEYCLOAK_ISSUER,
+    MOCK_TEST_USER,
+    _bad_token_cache,
+    get_current_user,
+    get_keycloak_public_key,
+    verify_token,
+)
 
-class TestGetKeycloakPublicKey:
-    """Tests for get_keycloak_public_key function."""
 
-    def test_public_key_fetch_success(self):
-        """Test successful public key fetch."""
-        from app.middleware.auth import get_keycloak_public_key
+def fake_response(payload: dict) -> SimpleNamespace:
+    """Stand-in for an httpx response exposing only what the realm fetch uses."""
+    return SimpleNamespace(json=lambda: payload, raise_for_status=lambda: None)
 
-        # Clear cache before test
-        get_keycloak_public_key.cache_clear()
 
-        mock_realm_data = {"public_key": "MOCK_PUBLIC_KEY_DATA"}
+# Keycloak realm response for tests that only need a key to be found
+MOCK_KEYCLOAK_RESPONSE = fake_response({"public_key": "MOCK_KEY"})
 
-        with patch("app.middleware.auth.httpx.get") as mock_get:
-            mock_response = MagicMock()
-            mock_response.json.return_value = mock_realm_data
-            mock_response.raise_for_status = MagicMock()
-            mock_get.return_value = mock_response
 
-            result = get_keycloak_public_key()
+def make_token(**claims) -> str:
+    """Build a structurally valid JWT (signature is never checked, decode is mocked)."""
+    payload = {"iss": KEYCLOAK_ISSUER, "aud": config.KEYCLOAK_AUDIENCE, "sub": "user-123"}
+    payload.update(claims)
+    return jwt.encode(payload, "test-secret", algorithm="HS256")
 
-            assert "BEGIN PUBLIC KEY" in result
-            assert "MOCK_PUBLIC_KEY_DATA" in result
-            assert "END PUBLIC KEY" in result
 
-    def test_public_key_fetch_missing_key(self):
-        """Test public key fetch when key not in response."""
-        from app.middleware.auth import get_keycloak_public_key
+@pytest.fixture(autouse=True)
+def clear_bad_token_cache():
+    """Keep rejected tokens from leaking between tests."""
+    _bad_token_cache.clear()
+    yield
+    _bad_token_cache.clear()
 
-        get_keycloak_public_key.cache_clear()
 
-        with patch("app.middleware.auth.httpx.get") as mock_get:
-            mock_response = MagicMock()
-            mock_response.json.return_value = {}  # No public_key
-            mock_response.raise_for_status = MagicMock()
-            mock_get.return_value = mock_response
+@pytest.fixture
+def keycloak_get(monkeypatch):
+    """
+    Replace the realm fetch with a mock answering MOCK_KEYCLOAK_RESPONSE.
+    
+    The cached public key is cleared around the test so the mock is actually
+    called; tests that never reach Keycloak (testing mode, rejected claims)
+    don't request this fixture.
+    """
+    mock_get = MagicMock(return_value=MOCK_KEYCLOAK_RESPONSE)
+    monkeypatch.setattr("app.middleware.auth.httpx.get", mock_get)
+    get_keycloak_public_key.cache_clear()
+    yield mock_get
+    get_keycloak_public_key.cache_clear()
 
-            with pytest.raises(HTTPException) as exc_info:
-                get_keycloak_public_key()
 
-            assert exc_info.value.status_code == 503
+class TestGetKeycloakPublicKey:
+    """Tests for get_keycloak_public_key function."""
+    def test_public_key_fetch_success(self, keycloak_get):
+        """Test successful public key fetch."""
+        result = get_keycloak_public_key()
 
-    def test_public_key_fetch_connection_error(self):
-        """Test public key fetch with connection error."""
-        from app.middleware.auth import get_keycloak_public_key
+        assert "BEGIN PUBLIC KEY" in result
+        assert "MOCK_KEY" in result
+        assert "END PUBLIC KEY" in result
+
+    def test_public_key_fetch_missing_key(self, keycloak_get):
+        """Test public key fetch when key not in response."""
+        keycloak_get.return_value = fake_response({})  # No public_key
 
-        get_keycloak_public_key.cache_clear()
+        with pytest.raises(HTTPException) as exc_info:
+            get_keycloak_public_key()
 
-        with patch("app.middleware.auth.httpx.get") as mock_get:
-            mock_get.side_effect = Exception("Connection failed")
+        assert exc_info.value.status_code == 503
 
-            with pytest.raises(HTTPException) as exc_info:
-                get_keycloak_public_key()
+    def test_public_key_fetch_connection_error(self, keycloak_get):
+        """Test public key fetch with connection error."""
+        keycloak_get.side_effect = Exception("Connection failed")
 
-            assert exc_info.value.status_code == 503
-            assert "Unable to connect" in exc_info.value.detail
+        with pytest.raises(HTTPException) as exc_info:
+            get_keycloak_public_key()
+
+        assert exc_info.value.status_code == 503
+        assert "Unable to connect" in exc_info.value.detail
 
 
 class TestVerifyToken:
     """Tests for verify_token function."""
-
     def test_verify_token_no_credentials(self):
         """Test verify_token raises 401 when no credentials."""
-        from app.middleware.auth import verify_token
-
         with patch("app.middleware.auth.TESTING", False):
             with pytest.raises(HTTPException) as exc_info:
                 verify_token(credentials=None)
@@ -79,8 +100,6 @@ class TestVerifyToken:
 
     def test_verify_token_testing_mode_with_credentials(self):
         """Test verify_token in testing mode with credentials."""
-        from app.middleware.auth import verify_token, MOCK_TEST_USER
-
         with patch("app.middleware.auth.TESTING", True):
             credentials = HTTPAuthorizationCredentials(scheme="Bearer", credentials="fake-token")
             result = verify_token(credentials=credentials)
@@ -90,31 +109,19 @@ class TestVerifyToken:
 
     def test_verify_token_testing_mode_no_credentials(self):
         """Test verify_token in testing mode without credentials."""
-        from app.middleware.auth import verify_token
-
         with patch("app.middleware.auth.TESTING", True):
             with pytest.raises(HTTPException) as exc_info:
                 verify_token(credentials=None)
 
             assert exc_info.value.status_code == 401
 
-    def test_verify_token_valid_jwt(self):
+    def test_verify_token_valid_jwt(self, keycloak_get):
         """Test verify_token with valid JWT."""
-        from app.middleware.auth import verify_token, get_keycloak_public_key
-
-        get_keycloak_public_key.cache_clear()
-
         mock_public_key = "-----BEGIN PUBLIC KEY-----\nMOCK_KEY\n-----END PUBLIC KEY-----"
 
         with patch("app.middleware.auth.TESTING", False), \
-             patch("app.middleware.auth.httpx.get") as mock_get, \
              patch("app.middleware.auth.jwt.decode") as mock_decode:
 
-            mock_response = MagicMock()
-            mock_response.json.return_value = {"public_key": "MOCK_KEY"}
-            mock_response.raise_for_status = MagicMock()
-            mock_get.return_value = mock_response
-
             mock_decode.return_value = {
                 "sub": "user-123",
                 "email": "test@example.com",
@@ -122,31 +129,20 @@ class TestVerifyToken:
                 "family_name": "User"
             }
 
-            credentials = HTTPAuthorizationCredentials(scheme="Bearer", credentials="fake-token")
+            credentials = HTTPAuthorizationCredentials(scheme="Bearer", credentials=make_token())
             result = verify_token(credentials=credentials)
 
             assert result["sub"] == "user-123"
             assert result["email"] == "test@example.com"
 
-    def test_verify_token_jwt_error(self):
+    def test_verify_token_jwt_error(self, keycloak_get):
         """Test verify_token with JWT validation error."""
-        from app.middleware.auth import verify_token, get_keycloak_public_key
-        from jose import JWTError
-
-        get_keycloak_public_key.cache_clear()
-
         with patch("app.middleware.auth.TESTING", False), \
-             patch("app.middleware.auth.httpx.get") as mock_get, \
              patch("app.middleware.auth.jwt.decode") as mock_decode:
 
-            mock_response = MagicMock()
-            mock_response.json.return_value = {"public_key": "MOCK_KEY"}
-            mock_response.raise_for_status = MagicMock()
-            mock_get.return_value = mock_response
-
             mock_decode.side_effect = JWTError("Token expired")
 
-            credentials = HTTPAuthorizationCredentials(scheme="Bearer", credentials="fake-token")
+            credentials = HTTPAuthorizationCredentials(scheme="Bearer", credentials=make_token())
 
             with pytest.raises(HTTPException) as exc_info:
                 verify_token(credentials=credentials)
@@ -154,24 +150,60 @@ class TestVerifyToken:
             assert exc_info.value.status_code == 401
             assert "Invalid or expired token" in exc_info.value.detail
 
-    def test_verify_token_generic_exception(self):
-        """Test verify_token with generic exception."""
-        from app.middleware.auth import verify_token, get_keycloak_public_key
+    @pytest.mark.parametrize("claims", [
+        {"aud": "another-client"},
+        {"aud": ["another-client", "broker"]},
+        {"iss": "https://evil.example.com/realms/crewup"},
+    ])
+    def test_verify_token_wrong_issuer_or_audience(self, claims):
+        """Misrouted tokens are rejected before signature verification."""
+        with patch("app.middleware.auth.TESTING", False), \
+             patch("app.middleware.auth.get_keycloak_public_key") as mock_key, \
+             patch("app.middleware.auth.jwt.decode") as mock_decode:
+
+            credentials = HTTPAuthorizationCredentials(scheme="Bearer", credentials=make_token(**claims))
+
+            with pytest.raises(HTTPException) as exc_info:
+                verify_token(credentials=credentials)
+
+            assert exc_info.value.status_code == 401
+            mock_key.assert_not_called()
+            mock_decode.assert_not_called()
+
+    def test_verify_token_malformed_token(self):
+        """A token that is not a JWT at all is rejected with 401."""
+        with patch("app.middleware.auth.TESTING", False):
+            credentials = HTTPAuthorizationCredentials(scheme="Bearer", credentials="not-a-jwt")
+
+            with pytest.raises(HTTPException) as exc_info:
+                verify_token(credentials=credentials)
 
-        get_keycloak_public_key.cache_clear()
+            assert exc_info.value.status_code == 401
 
+    def test_verify_token_rejected_token_is_cached(self, keycloak_get):
+        """A token that failed verification is refused again without decoding."""
         with patch("app.middleware.auth.TESTING", False), \
-             patch("app.middleware.auth.httpx.get") as mock_get, \
              patch("app.middleware.auth.jwt.decode") as mock_decode:
 
-            mock_response = MagicMock()
-            mock_response.json.return_value = {"public_key": "MOCK_KEY"}
-            mock_response.raise_for_status = MagicMock()
-            mock_get.return_value = mock_response
+            mock_decode.side_effect = JWTError("Signature verification failed")
+
+            credentials = HTTPAuthorizationCredentials(scheme="Bearer", credentials=make_token(sub="bad"))
+
+            for _ in range(3):
+                with pytest.raises(HTTPException) as exc_info:
+                    verify_token(credentials=credentials)
+                assert exc_info.value.status_code == 401
+
+            assert mock_decode.call_count == 1
+
+    def test_verify_token_generic_exception(self, keycloak_get):
+        """Test verify_token with generic exception."""
+        with patch("app.middleware.auth.TESTING", False), \
+             patch("app.middleware.auth.jwt.decode") as mock_decode:
 
             mock_decode.side_effect = Exception("Unexpected error")
 
-            credentials = HTTPAuthorizationCredentials(scheme="Bearer", credentials="fake-token")
+            credentials = HTTPAuthorizationCredentials(scheme="Bearer", credentials=make_token())
 
             with pytest.raises(HTTPException) as exc_info:
                 verify_token(credentials=credentials)
@@ -182,12 +214,9 @@ class TestVerifyToken:
 
 class TestGetCurrentUser:
     """Tests for get_current_user function."""
-
     @pytest.mark.asyncio
     async def test_get_current_user_extracts_info(self):
         """Test get_current_user extracts user info from token payload."""
-        from app.middleware.auth import get_current_user
-
         token_payload = {
             "sub": "keycloak-user-id",
             "email": "user@example.com",
@@ -207,8 +236,6 @@ class TestGetCurrentUser:
     @pytest.mark.asyncio
     async def test_get_current_user_handles_missing_fields(self):
         """Test get_current_user handles missing optional fields."""
-        from app.middleware.auth import get_current_user
-
         token_payload = {
             "sub": "keycloak-user-id"
             # Missing all optional fields
@@ -0,0 +1,317 @@
+"""Tests for the Redis user and group gate caches."""
+import pytest
+from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+from app.cache import AlertListCache, CachedUser, EventWindow, GroupGateCache, UserCache
+
+
+class FakeRedis:
+    """Minimal async stand-in for redis.asyncio.Redis."""
+
+    def __init__(self):
+        self.store = {}
+
+    async def get(self, key):
+        return self.store.get(key)
+
+    async def set(self, key, value, ex=None):
+        self.store[key] = value
+
+    async def delete(self, *keys):
+        for key in keys:
+            self.store.pop(key, None)
+
+    async def hget(self, key, field):
+        return self.store.get(key, {}).get(field)
+
+    async def hset(self, key, field, value):
+        self.store.setdefault(key, {})[field] = value
+
+    async def sadd(self, key, *members):
+        self.store.setdefault(key, set()).update(m.encode() for m in members)
+
+    async def sismember(self, key, member):
+        return member.encode() in self.store.get(key, set())
+
+    async def expire(self, key, seconds, nx=False):
+        return key in self.store
+
+
+def make_user(**overrides):
+    """Build a CachedUser with sensible defaults."""
+    fields = dict(
+        id=uuid4(), keycloak_id="kc-1", email="test@example.com",
+        first_name="Test", last_name="User", is_banned=False
+    )
+    fields.update(overrides)
+    return CachedUser(**fields)
+
+
+class TestUserCache:
+    """Test UserCache get/set."""
+
+    @pytest.mark.asyncio
+    async def test_disabled_without_redis(self):
+        """Without Redis every lookup is a miss and writes are no-ops."""
+        cache = UserCache(ttl=60)
+
+        await cache.set(make_user())
+
+        assert await cache.get("kc-1") is None
+
+    @pytest.mark.asyncio
+    async def test_roundtrip(self):
+        """A cached user comes back with the same fields."""
+        cache = UserCache(ttl=60)
+        cache.redis_client = FakeRedis()
+        user = make_user()
+
+        await cache.set(user)
+
+        assert await cache.get("kc-1") == user
+
+    @pytest.mark.asyncio
+    async def test_banned_user_not_cached(self):
+        """Banned users always go back to the database."""
+        cache = UserCache(ttl=60)
+        cache.redis_client = FakeRedis()
+
+        await cache.set(make_user(is_banned=True))
+
+        assert await cache.get("kc-1") is None
+
+    @pytest.mark.asyncio
+    async def test_redis_error_is_a_miss(self):
+        """Redis failures fall back to the database instead of failing the request."""
+        cache = UserCache(ttl=60)
+        cache.redis_client = AsyncMock()
+        cache.redis_client.get.side_effect = ConnectionError("down")
+
+        assert await cache.get("kc-1") is None
+
+
+def test_cache_hit_skips_database(client, db_session, mock_user, monkeypatch):
+    """A cached user is served without a users SELECT."""
+    from app.cache import user_cache
+
+    fake = FakeRedis()
+    monkeypatch.setattr(user_cache, "redis_client", fake)
+
+    # First request loads from the database and fills the cache
+    response = client.get("/api/v1/safety/my-alerts", headers={"Authorization": "Bearer mock-token"})
+    assert response.status_code == 200
+    assert fake.store
+
+    # Remove the row: only the cache can still resolve the user
+    db_session.delete(mock_user)
+    db_session.commit()
+
+    response = client.get("/api/v1/safety/my-alerts", headers={"Authorization": "Bearer mock-token"})
+    assert response.status_code == 200
+
+
+class TestGroupGateCache:
+    """Test GroupGateCache event windows and memberships."""
+
+    @pytest.mark.asyncio
+    async def test_disabled_without_redis(self):
+        """Without Redis windows are misses and nobody is a known member."""
+        cache = GroupGateCache(ttl=30)
+        group_id, user_id = uuid4(), uuid4()
+
+        await cache.set_event_window(group_id, EventWindow(datetime.now(timezone.utc), None))
+        await cache.add_member(group_id, user_id)
+
+        assert await cache.get_event_window(group_id) is None
+        assert await cache.is_member(group_id, user_id) is False
+
+    @pytest.mark.parametrize("start_hours,end_hours,cancelled", [
+        (-1, 3, False),      # in progress
+        (1, 5, False),       # starts within the 2h margin
+        (3, 6, False),       # starts later
+        (-6, -1, False),     # ended within the 2h margin
+        (-8, -3, False),     # ended
+        (-1, None, False),   # no end, 24h default
+        (-30, None, False),  # no end, default window passed
+        (-1, 3, True),       # cancelled
+    ])
+    @pytest.mark.parametrize("tz", [timezone.utc, None])
+    @pytest.mark.asyncio
+    async def test_window_roundtrip_keeps_verdict(self, start_hours, end_hours, cancelled, tz):
+        """A window read back from Redis is active exactly when the original is."""
+        from app.routers import is_event_active
+
+        now = datetime.now(timezone.utc).replace(tzinfo=tz)
+        window = EventWindow(
+            event_start=now + timedelta(hours=start_hours),
+            event_end=now + timedelta(hours=end_hours) if end_hours is not None else None,
+            is_cancelled=cancelled
+        )
+        cache = GroupGateCache(ttl=30)
+        cache.redis_client = FakeRedis()
+        group_id = uuid4()
+
+        await cache.set_event_window(group_id, window)
+        cached = await cache.get_event_window(group_id)
+
+        assert cached == window
+        assert is_event_active(cached) is is_event_active(window)
+
+    @pytest.mark.asyncio
+    async def test_membership(self):
+        """Only added users are known members."""
+        cache = GroupGateCache(ttl=30)
+        cache.redis_client = FakeRedis()
+        group_id, member_id = uuid4(), uuid4()
+
+        await cache.add_member(group_id, member_id)
+
+        assert await cache.is_member(group_id, member_id) is True
+        assert await cache.is_member(group_id, uuid4()) is False
+
+    @pytest.mark.asyncio
+    async def test_redis_error_is_a_miss(self):
+        """Redis failures fall back to the database instead of failing the request."""
+        cache = GroupGateCache(ttl=30)
+        cache.redis_client = AsyncMock()
+        cache.redis_client.get.side_effect = ConnectionError("down")
+        cache.redis_client.sismember.side_effect = ConnectionError("down")
+
+        assert await cache.get_event_window(uuid4()) is None
+        assert await cache.is_member(uuid4(), uuid4()) is False
+
+
+def test_gate_cache_hit_skips_database(client, mock_group, mock_group_member, monkeypatch):
+    """Once a group's gate is cached, new alerts don't query the group, member or event tables."""
+    from app import routers
+    from app.cache import group_gate_cache
+    from app.main import app
+
+    monkeypatch.setattr(group_gate_cache, "redis_client", FakeRedis())
+    load_group_gate = MagicMock(wraps=routers.load_group_gate)
+    monkeypatch.setattr(routers, "load_group_gate", load_group_gate)
+    monkeypatch.setattr(app.state.group_client, "broadcast_alert", AsyncMock())
+
+    for _ in range(2):
+        response = client.post(
+            "/api/v1/safety",
+            json={"group_id": str(mock_group.id), "alert_type": "help"},
+            headers={"Authorization": "Bearer mock-token"}
+        )
+        assert response.status_code == 201
+
+    assert load_group_gate.call_count == 1
+
+
+def test_gate_rejects_inactive_cached_window(client, mock_group, mock_group_member, mock_user, monkeypatch):
+    """A cached window is re-evaluated against the current time."""
+    import asyncio
+    from app.cache import group_gate_cache
+
+    monkeypatch.setattr(group_gate_cache, "redis_client", FakeRedis())
+    ended = datetime.now(timezone.utc) - timedelta(hours=5)
+    asyncio.run(group_gate_cache.set_event_window(mock_group.id, EventWindow(ended - timedelta(hours=2), ended)))
+    asyncio.run(group_gate_cache.add_member(mock_group.id, mock_user.id))
+
+    response = client.post(
+        "/api/v1/safety",
+        json={"group_id": str(mock_group.id), "alert_type": "help"},
+        headers={"Authorization": "Bearer mock-token"}
+    )
+
+    assert response.status_code == 400
+
+
+class TestAlertListCache:
+    """Test AlertListCache pages and invalidation."""
+
+    @pytest.mark.asyncio
+    async def test_disabled_without_redis(self):
+        """Without Redis the cache reports disabled and every page is a miss."""
+        cache = AlertListCache(ttl=15)
+        group_id = uuid4()
+
+        await cache.set(group_id, None, 50, 0, b"{}")
+
+        assert cache.enabled is False
+        assert await cache.get(group_id, None, 50, 0) is None
+
+    @pytest.mark.asyncio
+    async def test_pages_keyed_by_filters(self):
+        """Each filter/window combination is its own page."""
+        cache = AlertListCache(ttl=15)
+        cache.redis_client = FakeRedis()
+        group_id = uuid4()
+
+        await cache.set(group_id, None, 50, 0, b"all")
+        await cache.set(group_id, False, 50, 0, b"open")
+
+        assert await cache.get(group_id, None, 50, 0) == b"all"
+        assert await cache.get(group_id, False, 50, 0) == b"open"
+        assert await cache.get(group_id, None, 50, 50) is None
+
+    @pytest.mark.asyncio
+    async def test_invalidate_drops_only_given_groups(self):
+        """Invalidating a group drops all of its pages and none of another group's."""
+        cache = AlertListCache(ttl=15)
+        cache.redis_client = FakeRedis()
+        group_id, other_group_id = uuid4(), uuid4()
+        await cache.set(group_id, None, 50, 0, b"a")
+        await cache.set(group_id, True, 10, 0, b"b")
+        await cache.set(other_group_id, None, 50, 0, b"c")
+
+        await cache.invalidate(group_id)
+
+        assert await cache.get(group_id, None, 50, 0) is None
+        assert await cache.get(group_id, True, 10, 0) is None
+        assert await cache.get(other_group_id, None, 50, 0) == b"c"
+
+
+@pytest.fixture
+def redis_caches(monkeypatch):
+    """Point every cache at one shared FakeRedis."""
+    from app.cache import alert_list_cache, group_gate_cache, user_cache
+
+    fake = FakeRedis()
+    for cache in (user_cache, group_gate_cache, alert_list_cache):
+        monkeypatch.setattr(cache, "redis_client", fake)
+    return fake
+
+
+def test_group_list_served_from_cache_until_invalidated(client, db_session, mock_user, mock_group, mock_group_member, redis_caches, monkeypatch):
+    """Group listings are cached; creating an alert drops the cached pages."""
+    from app.db import SafetyAlert
+    from app.main import app
+
+    monkeypatch.setattr(app.state.group_client, "broadcast_alert", AsyncMock())
+    db_session.add(SafetyAlert(user_id=mock_user.id, group_id=mock_group.id, alert_type="help"))
+    db_session.commit()
+    url = f"/api/v1/safety?group_id={mock_group.id}"
+    headers = {"Authorization": "Bearer mock-token"}
+
+    assert client.get(url, headers=headers).json()["total"] == 1
+
+    # Added behind the API's back: the cached page still answers
+    db_session.add(SafetyAlert(user_id=mock_user.id, group_id=mock_group.id, alert_type="help"))
+    db_session.commit()
+    assert client.get(url, headers=headers).json()["total"] == 1
+
+    # Creating through the API invalidates the group's pages
+    response = client.post("/api/v1/safety", json={"group_id": str(mock_group.id), "alert_type": "help"}, headers=headers)
+    assert response.status_code == 201
+    assert client.get(url, headers=headers).json()["total"] == 3
+
+
+def test_cached_group_list_requires_membership(client, db_session, mock_user, mock_group, redis_caches):
+    """A cached page is never served to a caller outside the group."""
+    import asyncio
+    from app.cache import alert_list_cache
+
+    asyncio.run(alert_list_cache.set(mock_group.id, None, 50, 0, b'{"alerts": [], "total": 99, "limit": 50, "offset": 0}'))
+
+    response = client.get(f"/api/v1/safety?group_id={mock_group.id}", headers={"Authorization": "Bearer mock-token"})
+
+    assert response.status_code == 200
+    assert response.json()["total"] == 0
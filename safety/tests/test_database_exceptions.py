@@ -88,3 +88,18 @@ class TestExceptionHandlers:
         assert response.status_code == 500
         body = response.body.decode()
         assert "INTERNAL_ERROR" in body
+
+
+def test_endpoint_database_error_uses_registered_handler(client, mock_user, monkeypatch):
+    """Endpoints don't catch errors themselves: a database failure reaches database_exception_handler."""
+    from app import routers
+
+    def failing_fetch(*args):
+        raise SQLAlchemyError("Connection lost")
+
+    monkeypatch.setattr(routers, "fetch_alert_list", failing_fetch)
+
+    response = client.get("/api/v1/safety", headers={"Authorization": "Bearer mock-token"})
+
+    assert response.status_code == 500
+    assert response.json()["error"]["code"] == "DATABASE_ERROR"
@@ -3,21 +3,25 @@ Additional tests for edge cases and error paths to increase coverage.
 """
 import pytest
 from fastapi import status
+from sqlalchemy import update
 from datetime import datetime, timedelta, timezone
 from uuid import uuid4
 
 from app.db.models import SafetyAlert, Event, Group, GroupMember
+from app.utils.exceptions import BadRequestException, ForbiddenException, NotFoundException, UnauthorizedException
 
 
 class TestEventValidation:
     """Test event state validation for alerts."""
     
-    def test_create_alert_event_not_started(self, client, mock_user, mock_group_member, db_session):
+    def test_create_alert_event_not_started(self, client, mock_event, mock_group_member, db_session, now):
         """Cannot create alert for event that starts >2h in future (outside margin)."""
         # Update event to start >2h in future (outside 2h margin)
-        event = db_session.query(Event).first()
-        event.event_start = datetime.now(timezone.utc) + timedelta(hours=3)
-        event.event_end = datetime.now(timezone.utc) + timedelta(hours=5)
+        db_session.execute(
+            update(Event)
+            .where(Event.id == mock_event.id)
+            .values(event_start=now + timedelta(hours=3), event_end=now + timedelta(hours=5))
+        )
         db_session.commit()
         
         alert_data = {
@@ -32,12 +36,14 @@ class TestEventValidation:
         assert response.status_code == status.HTTP_400_BAD_REQUEST
         assert "active events" in response.json()["detail"].lower()
     
-    def test_create_alert_event_ended(self, client, mock_user, mock_group_member, db_session):
+    def test_create_alert_event_ended(self, client, mock_event, mock_group_member, db_session, now):
         """Cannot create alert for event ended >2h ago (outside margin)."""
         # Update event to end >2h ago (outside 2h margin)
-        event = db_session.query(Event).first()
-        event.event_start = datetime.now(timezone.utc) - timedelta(hours=5)
-        event.event_end = datetime.now(timezone.utc) - timedelta(hours=3)
+        db_session.execute(
+            update(Event)
+            .where(Event.id == mock_event.id)
+            .values(event_start=now - timedelta(hours=5), event_end=now - timedelta(hours=3))
+        )
         db_session.commit()
         
         alert_data = {
@@ -52,11 +58,10 @@ class TestEventValidation:
         assert response.status_code == status.HTTP_400_BAD_REQUEST
         assert "active events" in response.json()["detail"].lower()
     
-    def test_create_alert_event_cancelled(self, client, mock_user, mock_group_member, db_session):
+    def test_create_alert_event_cancelled(self, client, mock_event, mock_group_member, db_session):
         """Cannot create alert for cancelled event."""
         # Cancel the event
-        event = db_session.query(Event).first()
-        event.is_cancelled = True
+        db_session.execute(update(Event).where(Event.id == mock_event.id).values(is_cancelled=True))
         db_session.commit()
         
         alert_data = {
@@ -75,49 +80,26 @@ class TestEventValidation:
 class TestAlertTypes:
     """Test different alert types."""
     
-    def test_create_alert_type_medical(self, client, mock_group_member):
-        """Create medical alert."""
-        alert_data = {
-            "group_id": str(mock_group_member.group_id),
-            "latitude": 65.584819,
-            "longitude": 22.154984,
-            "alert_type": "medical",
-            "message": "Medical alert"
-        }
-        
-        response = client.post("/api/v1/safety", json=alert_data)
-        assert response.status_code == status.HTTP_201_CREATED
-        data = response.json()
-        assert data["alert_type"] == "medical"
-    
-    def test_create_alert_type_other(self, client, mock_group_member):
-        """Create other type alert."""
+    @pytest.mark.parametrize("alert_type,expected", [
+        ("medical", "medical"),
+        ("other", "other"),
+        (None, "help"),  # Unspecified: defaults to help
+    ], ids=["medical", "other", "default"])
+    def test_create_alert_type(self, client, mock_group_member, alert_type, expected):
+        """Alerts keep their type, and default to help when none is given."""
         alert_data = {
             "group_id": str(mock_group_member.group_id),
             "latitude": 65.584819,
             "longitude": 22.154984,
-            "alert_type": "other",
-            "message": "Other alert"
+            "message": f"{expected.capitalize()} alert"
         }
+        if alert_type is not None:
+            alert_data["alert_type"] = alert_type
         
         response = client.post("/api/v1/safety", json=alert_data)
         assert response.status_code == status.HTTP_201_CREATED
         data = response.json()
-        assert data["alert_type"] == "other"
-    
-    def test_create_alert_default_type_help(self, client, mock_group_member):
-        """Create alert without specifying type (defaults to help)."""
-        alert_data = {
-            "group_id": str(mock_group_member.group_id),
-            "latitude": 65.584819,
-            "longitude": 22.154984,
-            "message": "Default type alert"
-        }
-        
-        response = client.post("/api/v1/safety", json=alert_data)
-        assert response.status_code == status.HTTP_201_CREATED
-        data = response.json()
-        assert data["alert_type"] == "help"  # Default value
+        assert data["alert_type"] == expected
 
 
 class TestAlertResolution:
@@ -159,37 +141,17 @@ class TestAlertResolution:
 class TestExceptionHandlers:
     """Test custom exception classes."""
     
-    def test_not_found_exception(self):
-        """Test NotFoundException."""
-        from app.utils.exceptions import NotFoundException
-        
-        exc = NotFoundException("Test not found")
-        assert exc.status_code == 404
-        assert exc.detail == "Test not found"
-    
-    def test_bad_request_exception(self):
-        """Test BadRequestException."""
-        from app.utils.exceptions import BadRequestException
-        
-        exc = BadRequestException("Bad request")
-        assert exc.status_code == 400
-        assert exc.detail == "Bad request"
-    
-    def test_unauthorized_exception(self):
-        """Test UnauthorizedException."""
-        from app.utils.exceptions import UnauthorizedException
-        
-        exc = UnauthorizedException("Not authorized")
-        assert exc.status_code == 401
-        assert exc.detail == "Not authorized"
-    
-    def test_forbidden_exception(self):
-        """Test ForbiddenException."""
-        from app.utils.exceptions import ForbiddenException
-        
-        exc = ForbiddenException("Forbidden")
-        assert exc.status_code == 403
-        assert exc.detail == "Forbidden"
+    @pytest.mark.parametrize("exc_class,status_code", [
+        (NotFoundException, 404),
+        (BadRequestException, 400),
+        (UnauthorizedException, 401),
+        (ForbiddenException, 403),
+    ], ids=lambda param: getattr(param, "__name__", None))
+    def test_exception_status(self, exc_class, status_code):
+        """Each exception carries its HTTP status and the given detail."""
+        exc = exc_class("Test detail")
+        assert exc.status_code == status_code
+        assert exc.detail == "Test detail"
 
 
 class TestSafetyException:
@@ -207,27 +169,11 @@ class TestSafetyException:
 class TestListFiltering:
     """Test alert list filtering combinations."""
     
-    def test_list_alerts_filter_by_type_harassment(self, client, mock_user, mock_group_member, db_session):
+    def test_list_alerts_filter_by_type_harassment(self, client, make_alerts, mock_group_member):
         """Filter alerts by harassment type."""
         # Create different alert types
-        alert1 = SafetyAlert(
-            id=uuid4(),
-            user_id=mock_user.id,
-            group_id=mock_group_member.group_id,
-            latitude=65.58,
-            longitude=22.15,
-            alert_type="harassment"
-        )
-        alert2 = SafetyAlert(
-            id=uuid4(),
-            user_id=mock_user.id,
-            group_id=mock_group_member.group_id,
-            latitude=65.58,
-            longitude=22.15,
-            alert_type="help"
-        )
-        db_session.add_all([alert1, alert2])
-        db_session.commit()
+        make_alerts(1, alert_type="harassment", latitude=65.58, longitude=22.15)
+        make_alerts(1, alert_type="help", latitude=65.58, longitude=22.15)
         
         response = client.get("/api/v1/safety?alert_type=harassment")
         assert response.status_code == status.HTTP_200_OK
@@ -236,21 +182,10 @@ class TestListFiltering:
         harassment_alerts = [a for a in data["alerts"] if a["alert_type"] == "harassment"]
         assert len(harassment_alerts) >= 1
     
-    def test_list_alerts_pagination(self, client, mock_user, mock_group_member, db_session):
+    def test_list_alerts_pagination(self, client, make_alerts, mock_group_member):
         """Test pagination with limit and offset."""
         # Create multiple alerts
-        for i in range(5):
-            alert = SafetyAlert(
-                id=uuid4(),
-                user_id=mock_user.id,
-                group_id=mock_group_member.group_id,
-                latitude=65.58,
-                longitude=22.15,
-                alert_type="help",
-                message=f"Alert {i}"
-            )
-            db_session.add(alert)
-        db_session.commit()
+        make_alerts(5, latitude=65.58, longitude=22.15)
         
         # Get first 2
         response = client.get("/api/v1/safety?limit=2&offset=0")
@@ -264,34 +199,44 @@ class TestListFiltering:
         assert response.status_code == status.HTTP_200_OK
         data = response.json()
         assert len(data["alerts"]) == 2
-    
-    def test_list_alerts_combined_filters(self, client, mock_user, mock_group_member, db_session):
+
+    def test_list_alerts_keyset_pagination(self, client, make_alerts, mock_group_member, now):
+        """Following next_cursor walks every alert once, newest first."""
+        # Explicit, distinct timestamps (one tie broken by id), newest first
+        created = [now - timedelta(minutes=m) for m in (0, 1, 1, 2, 3)]
+        ids = [uuid4() for _ in created]
+        for alert_id, created_at in zip(ids, created):
+            make_alerts(1, id=alert_id, created_at=created_at, latitude=65.58, longitude=22.15)
+        expected = [str(alert_id) for _, alert_id in sorted(zip(created, ids), reverse=True)]
+
+        seen = []
+        url = "/api/v1/safety?limit=2"
+        for _ in range(len(expected)):
+            response = client.get(url)
+            assert response.status_code == status.HTTP_200_OK
+            data = response.json()
+            assert data["total"] == len(expected)
+            seen.append([alert["id"] for alert in data["alerts"]])
+            if not data["next_cursor"]:
+                break
+            url = f"/api/v1/safety?limit=2&cursor={data['next_cursor']}"
+        else:
+            pytest.fail(f"next_cursor never ran out; pages: {seen}")
+
+        assert [len(page) for page in seen] == [2, 2, 1]
+        assert [alert_id for page in seen for alert_id in page] == expected
+
+    @pytest.mark.parametrize("query", ["cursor=not-a-cursor", "cursor=MjAyNnxhYmM=&offset=2"])
+    def test_list_alerts_bad_cursor(self, client, mock_group_member, query):
+        """Malformed cursors, and cursors combined with offset, are rejected."""
+        response = client.get(f"/api/v1/safety?{query}")
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_list_alerts_combined_filters(self, client, make_alerts, mock_group_member, now):
         """Test combining multiple filters."""
         # Create resolved and unresolved alerts
-        alert1 = SafetyAlert(
-            id=uuid4(),
-            user_id=mock_user.id,
-            group_id=mock_group_member.group_id,
-            latitude=65.58,
-            longitude=22.15,
-            alert_type="help"
-        )
-        db_session.add(alert1)
-        db_session.commit()
-        
-        # Resolve it
-        alert1.resolved_at = datetime.now(timezone.utc)
-        
-        alert2 = SafetyAlert(
-            id=uuid4(),
-            user_id=mock_user.id,
-            group_id=mock_group_member.group_id,
-            latitude=65.58,
-            longitude=22.15,
-            alert_type="help"
-        )
-        db_session.add(alert2)
-        db_session.commit()
+        make_alerts(1, resolved_at=now, latitude=65.58, longitude=22.15)
+        make_alerts(1, latitude=65.58, longitude=22.15)
         
         # Filter by group and resolved status
         response = client.get(
@@ -68,7 +68,87 @@ def create_mock_user(user_id=None, keycloak_id=None):
     return user
 
 
-# Tests removed - broadcast functions tested elsewhere
+class TestBuildAlertBroadcast:
+    """Test the hand-built safety_alert payload."""
+
+    def test_matches_alert_broadcast_schema(self):
+        """Payload round-trips through AlertBroadcast unchanged."""
+        import json
+        from app.models import AlertBroadcast
+        from app.services import build_alert_broadcast
+
+        alert = Mock(
+            id=uuid4(), user_id=uuid4(), alert_type="medical", message="Help",
+            latitude=65.584819, longitude=None, created_at=datetime(2025, 1, 1, 12, 30)
+        )
+
+        payload = json.loads(build_alert_broadcast(alert, "Test User"))
+        broadcast = AlertBroadcast.model_validate(payload)
+
+        assert broadcast.model_dump(mode="json", exclude={"created_at"}) == {k: v for k, v in payload.items() if k != "created_at"}
+        # Naive database timestamps go out tagged as UTC
+        assert payload["created_at"] == "2025-01-01T12:30:00+00:00"
+        assert broadcast.created_at == datetime(2025, 1, 1, 12, 30, tzinfo=timezone.utc)
+
+
+class TestGroupClientResolution:
+    """Test GroupClient resolution broadcasts."""
+
+    @pytest.mark.asyncio
+    async def test_update_failure_does_not_cancel_broadcast(self):
+        """A failed PATCH still lets the broadcast POST go through."""
+        from app.services import GroupClient
+
+        client = Mock()
+        client.patch = AsyncMock(side_effect=httpx.ConnectError("down"))
+        client.post = AsyncMock(return_value=Mock(raise_for_status=Mock()))
+
+        result = await GroupClient(client).broadcast_resolution(uuid4(), uuid4(), "Test User")
+
+        assert result is False
+        client.patch.assert_awaited_once()
+        client.post.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_both_calls_succeed(self):
+        """Resolution succeeds when both update and broadcast succeed."""
+        from app.services import GroupClient
+
+        client = Mock()
+        client.patch = AsyncMock(return_value=Mock(raise_for_status=Mock()))
+        client.post = AsyncMock(return_value=Mock(raise_for_status=Mock()))
+
+        assert await GroupClient(client).broadcast_resolution(uuid4(), uuid4(), "Test User") is True
+
+    @pytest.mark.asyncio
+    async def test_batch_broadcast_is_bounded(self):
+        """Batch broadcasts run concurrently but never exceed BROADCAST_CONCURRENCY."""
+        import asyncio
+        from app.services import GroupClient
+        from app.services.group_client import BROADCAST_CONCURRENCY
+
+        in_flight = 0
+        peak = 0
+
+        async def fake_resolution(group_id, alert_id, resolver_name, **kwargs):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return True
+
+        batch = [(uuid4(), uuid4()) for _ in range(25)]
+        resolved_at = datetime.now(timezone.utc)
+        group_client = GroupClient(Mock())
+        with patch.object(group_client, "broadcast_resolution", side_effect=fake_resolution) as mock_resolution:
+            await group_client.broadcast_batch_resolution(batch, "Test User", resolved_at)
+
+        assert mock_resolution.call_count == 25
+        assert all(call.kwargs["resolved_at"] is resolved_at for call in mock_resolution.call_args_list)
+        assert 1 < peak <= BROADCAST_CONCURRENCY
+        # The PATCH body is serialized once and shared by the whole batch
+        assert len({id(call.kwargs["update_body"]) for call in mock_resolution.call_args_list}) == 1
 
 
 class TestIsEventActive: